@@ -18,21 +18,30 @@ AIDEV-NOTE: Label operations via X-GM-LABELS
 - No OAuth required, simplifying authentication flow
 """
 
+import contextlib
+import ctypes
 import hashlib
+import heapq
+import hmac
 import logging
+import math
 import random
 import re
+import secrets
 import ssl
 import string
+import sys
 import threading
 import time
 import uuid
-from collections import defaultdict
+import weakref
+from collections import Counter, OrderedDict, defaultdict, deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import Enum, StrEnum
 from time import sleep
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from imapclient import IMAPClient
 from imapclient.exceptions import IMAPClientError
@@ -46,6 +55,19 @@ if TYPE_CHECKING:
 CLEANUP_INTERVAL_SECONDS = 300  # Run cleanup every 5 minutes
 STALE_TIMEOUT_MINUTES = 25  # Sessions inactive for >25 minutes are stale
 MAX_SESSIONS_PER_EMAIL = 5  # Maximum concurrent sessions per email address
+# Connection pooling
+POOL_MAX_CONNECTIONS = 4  # Logged-in connections kept per email for reuse
+POOL_MAX_AGE_SECONDS = 600.0  # Pooled connections idle >10 minutes are logged out
+# Authentication rate limiting
+RATE_LIMIT_WINDOW_SECONDS = 900.0  # Failures older than 15 minutes are forgotten
+RATE_LIMIT_MAX_FAILURES = 5  # Failures within the window before lockout
+MAX_TRACKED_FAILURES = 64  # Per-email cap on remembered failure timestamps
+# Lockout seconds indexed by failure count: none below the threshold, then
+# 2^(n-4) minutes capped at 64 (index 10 and above)
+_LOCKOUT_SECONDS = tuple(
+    0 if n < RATE_LIMIT_MAX_FAILURES else min(2 ** (n - 4), 64) * 60
+    for n in range(11)
+)
 # ============================================================================
 # Constants
 # ============================================================================
@@ -53,6 +75,35 @@ MAX_SESSIONS_PER_EMAIL = 5  # Maximum concurrent sessions per email address
 # Email validation pattern (compiled once at module level for performance)
 EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
+# Password weak-pattern check: the same character 3 or more times in a row
+_REPEATED_CHARS_PATTERN = re.compile(r'(.)\1{2,}')
+_REPEATED_BYTES_PATTERN = re.compile(rb'(.)\1{2,}')
+# string.punctuation as byte values, for validating bytearray passwords in place
+_PUNCTUATION_BYTES = frozenset(string.punctuation.encode("ascii"))
+
+# Bound once so clearing a password is a single C call with no attribute lookups
+_MEMSET = ctypes.memset
+
+
+def _zero_password(
+    password_bytes: bytearray, pinned_view: list[ctypes.Array[ctypes.c_char] | None]
+) -> None:
+    """Zero and release a password buffer (IMAPCredentials finalizer callback).
+
+    Holds no reference to the credentials object. The cached ctypes view
+    lives only in a one-slot list shared with the credentials, so popping it
+    drops the last buffer export before clear() resizes the bytearray.
+
+    Args:
+        password_bytes: Password buffer to wipe
+        pinned_view: Single-element list holding the ctypes view (or None)
+    """
+    view = pinned_view.pop()
+    if view is not None:
+        _MEMSET(ctypes.addressof(view), 0, len(password_bytes))
+    del view
+    password_bytes.clear()
+
 
 # ============================================================================
 # Enums
@@ -71,6 +122,15 @@ class SessionState(Enum):
     CONNECTED = "connected"
     DISCONNECTED = "disconnected"
     ERROR = "error"
+class ErrorCode(StrEnum):
+    """Stable reasons attached to IMAPAuthenticationError.
+    Callers branch on IMAPAuthenticationError.code instead of scanning the
+    human-readable message, which is free to change.
+    """
+    AUTH_FAILED = "auth_failed"
+    BAD_CREDENTIALS = "bad_credentials"
+    LOCKED_OUT = "locked_out"
+    RATE_LIMITED = "rate_limited"
 # ============================================================================
 # Custom Exceptions
 # ============================================================================
@@ -81,8 +141,27 @@ class IMAPAuthenticationError(Exception):
     - IMAP disabled in Gmail settings
     - 2FA/app password issues
     - Account security blocks
+    - Rate limiting and lockout after repeated failures
+    Attributes:
+        code: ErrorCode identifying the failure reason
+        retry_after_seconds: Whole seconds until a retry may be admitted, for
+            lockouts; None when no wait is known
     """
-    pass
+    def __init__(
+        self,
+        message: str,
+        code: ErrorCode = ErrorCode.AUTH_FAILED,
+        retry_after_seconds: int | None = None,
+    ) -> None:
+        """Create the error.
+        Args:
+            message: Human-readable description
+            code: Failure reason (default: ErrorCode.AUTH_FAILED)
+            retry_after_seconds: Seconds until retrying may succeed (default: None)
+        """
+        super().__init__(message)
+        self.code = code
+        self.retry_after_seconds = retry_after_seconds
 class IMAPConnectionError(Exception):
     """Raised when IMAP connection cannot be established.
     This includes:
@@ -104,33 +183,117 @@ class IMAPSessionError(Exception):
 # ============================================================================
 # Data Classes
 # ============================================================================
-@dataclass
+@dataclass(init=False, slots=True, weakref_slot=True, repr=False, eq=False)
 class IMAPCredentials:
     """IMAP login credentials for Gmail authentication.
     Attributes:
         email: Gmail email address (e.g., user@gmail.com)
-        password: IMAP password or app-specific password (16 chars for app passwords)
+        password: IMAP password or app-specific password (16 chars for app passwords),
+            exposed as a read-only property backed by _password_bytes
         created_at: Timestamp when credentials were first stored
         last_used: Timestamp of last successful authentication (auto-updated)
+        key: Interned, lower-cased email used as the rate-limiting key
     Security considerations:
     - Never log password in plain text
     - Sanitize password from error messages
-    - Clear from memory after failed authentication
+    - Clear from memory after failed authentication (clear_password)
     - Use secure string comparison for validation
+    - Password is held in a mutable bytearray so it can be zeroed in place;
+      the str returned by the password property is an immutable copy
+    - Slotted with identity equality: instances carry no __dict__ and two
+      credential objects are never compared by secret
+    - A weakref.finalize callback zeroes the password on garbage collection
+      and at interpreter exit, without the __del__ resurrection pitfalls
     """
     email: str
-    password: str
-    created_at: datetime = field(default_factory=datetime.now)
-    last_used: datetime | None = None
-    def __post_init__(self) -> None:
-        """Validate email format and password constraints."""
+    created_at: datetime
+    last_used: datetime | None
+    _key: str
+    _password_bytes: bytearray
+    _pw_view: list[ctypes.Array[ctypes.c_char] | None]
+    _finalizer: weakref.finalize
+    def __init__(
+        self,
+        email: str,
+        password: str | bytearray,
+        created_at: datetime | None = None,
+        last_used: datetime | None = None,
+    ) -> None:
+        """Validate and store credentials.
+        Args:
+            email: Gmail email address
+            password: IMAP password or app-specific password. A bytearray
+                holding the UTF-8 password is adopted without copying, and
+                is zeroed in place by clear_password(); validating a
+                non-ASCII one decodes it to a str (see _validate_password)
+            created_at: Creation timestamp (default: now)
+            last_used: Last successful authentication (default: None)
+        Raises:
+            ValueError: Email format or password constraints invalid
+        """
         # Email format validation
-        if not EMAIL_PATTERN.match(self.email):
-            raise ValueError(f"Invalid email format: {self.email}")
+        if not EMAIL_PATTERN.match(email):
+            raise ValueError(f"Invalid email format: {email}")
         # Password validation with comprehensive security checks
-        self._validate_password()
-
-    def _validate_password(self) -> None:
+        self._validate_password(password)
+        if isinstance(password, bytearray):
+            password_bytes = password
+        else:
+            password_bytes = bytearray(password.encode("utf-8"))
+        self.email = email
+        self._key = sys.intern(email.lower())
+        self.created_at = created_at if created_at is not None else datetime.now()
+        self.last_used = last_used
+        self._store_password_bytes(password_bytes)
+    def _store_password_bytes(self, password_bytes: bytearray) -> None:
+        """Adopt an encoded password buffer and register its finalizer.
+        The c_char view over the bytearray is created once here so that
+        clear_password() can zero it without rebuilding the ctypes array.
+        Args:
+            password_bytes: UTF-8 encoded password (ownership is taken)
+        """
+        self._password_bytes = password_bytes
+        self._pw_view = [
+            (ctypes.c_char * len(password_bytes)).from_buffer(password_bytes)
+            if password_bytes
+            else None
+        ]
+        self._finalizer = weakref.finalize(
+            self, _zero_password, password_bytes, self._pw_view
+        )
+    @property
+    def key(self) -> str:
+        """Case-insensitive account key (email addresses compare case-insensitively)."""
+        return self._key
+    @property
+    def password(self) -> str:
+        """Decoded password.
+        Raises:
+            ValueError: Password has already been cleared from memory
+        """
+        if not self._password_bytes:
+            raise ValueError("Password has been cleared from memory")
+        return self._password_bytes.decode("utf-8")
+    def password_equals(self, other: str | bytes) -> bool:
+        """Compare the stored password against a candidate in constant time.
+        Uses hmac.compare_digest directly on the bytearray, so the comparison
+        neither short-circuits on the first differing byte nor makes an
+        immutable copy of the stored secret.
+        Args:
+            other: Candidate password (str is UTF-8 encoded first)
+        Returns:
+            True if the candidate matches the stored password
+        """
+        candidate = other.encode("utf-8") if isinstance(other, str) else other
+        return hmac.compare_digest(self._password_bytes, candidate)
+    def clear_password(self) -> None:
+        """Zero the password bytes in memory and release them.
+        Runs the finalizer early; safe to call multiple times since a
+        finalizer only ever fires once.
+        """
+        self._finalizer()
+    @staticmethod
+    def _validate_password(password: str | bytearray) -> None:
         """Validate password format and security requirements.
 
         Checks for:
@@ -139,18 +302,49 @@ class IMAPCredentials:
         - Complexity requirements (3 of 4 character types)
         - Weak patterns (repeated characters)
 
+        An ASCII bytearray is checked in place, byte by byte, so no str copy
+        of the secret is made. A non-ASCII bytearray is decoded first, since
+        the Unicode character classes need the text; that makes one
+        immutable str copy.
+
+        Args:
+            password: Password as str, or as a UTF-8 encoded bytearray
+
         Raises:
             ValueError: Password fails validation with specific guidance
 
         Security:
             Addresses CWE-521 (Weak Password Requirements)
         """
-        password = self.password
+        if isinstance(password, bytearray) and password.isascii():
+            length = len(password)
+            has_upper = any(0x41 <= byte <= 0x5A for byte in password)
+            has_lower = any(0x61 <= byte <= 0x7A for byte in password)
+            has_digit = any(0x30 <= byte <= 0x39 for byte in password)
+            has_special = any(byte in _PUNCTUATION_BYTES for byte in password)
+            # 16 letters once spaces are dropped (cf. str.isalpha below)
+            is_app_format = length - password.count(b" ") == 16 and all(
+                byte == 0x20 or 0x41 <= byte <= 0x5A or 0x61 <= byte <= 0x7A
+                for byte in password
+            )
+            app_is_lowercase = not has_upper
+            has_repeats = _REPEATED_BYTES_PATTERN.search(password) is not None
+        else:
+            if isinstance(password, bytearray):
+                password = password.decode("utf-8")
+            clean_password = password.replace(' ', '')
+            length = len(password)
+            has_upper = any(c.isupper() for c in password)
+            has_lower = any(c.islower() for c in password)
+            has_digit = any(c.isdigit() for c in password)
+            has_special = any(c in string.punctuation for c in password)
+            is_app_format = len(clean_password) == 16 and clean_password.isalpha()
+            app_is_lowercase = clean_password.islower()
+            has_repeats = _REPEATED_CHARS_PATTERN.search(password) is not None
 
         # Check for Gmail app password format (16 lowercase chars, possibly with spaces)
-        clean_password = password.replace(' ', '')
-        if len(clean_password) == 16 and clean_password.isalpha():
-            if not clean_password.islower():
+        if is_app_format:
+            if not app_is_lowercase:
                 raise ValueError(
                     "Gmail app passwords must be lowercase. "
                     "Generate a new app password at: "
@@ -161,11 +355,11 @@ class IMAPCredentials:
 
         # For non-app passwords, enforce stronger requirements
         # Basic length constraint (max 64 to prevent DoS)
-        if len(password) > 64:
+        if length > 64:
             raise ValueError("Password must not exceed 64 characters")
 
         # Minimum length requirement
-        if len(password) < 12:
+        if length < 12:
             raise ValueError(
                 "Regular passwords must be at least 12 characters. "
                 "Consider using a Gmail app password instead: "
@@ -173,11 +367,6 @@ class IMAPCredentials:
             )
 
         # Check complexity: require 3 of 4 character types
-        has_upper = any(c.isupper() for c in password)
-        has_lower = any(c.islower() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(c in string.punctuation for c in password)
-
         complexity_count = sum([has_upper, has_lower, has_digit, has_special])
         if complexity_count < 3:
             raise ValueError(
@@ -186,7 +375,7 @@ class IMAPCredentials:
             )
 
         # Check for weak patterns: 3 or more repeated characters
-        if re.search(r'(.)\1{2,}', password):
+        if has_repeats:
             raise ValueError("Password contains too many repeated characters")
 
     def __repr__(self) -> str:
@@ -202,8 +391,12 @@ class IMAPSessionInfo:
     Attributes:
         session_id: Unique identifier for this session (UUID)
         email: Email address associated with this session
+        account_key: Case-insensitive account key derived from email (matches
+            IMAPCredentials.key); groups sessions for the per-email limit
         connection: Active IMAPClient connection object (optional during initialization)
         selected_folder: Currently selected IMAP folder (e.g., "INBOX")
+        selected_folder_readonly: Whether selected_folder was opened read-only
+        selected_folder_meta: Metadata returned when selected_folder was selected
         connected_at: Timestamp when connection was established
         last_activity: Last IMAP command timestamp (for keepalive management)
         state: Current session state (SessionState enum)
@@ -218,13 +411,26 @@ class IMAPSessionInfo:
     email: str = ""
     connection: Optional["IMAPClient"] = None
     selected_folder: str | None = None
+    selected_folder_readonly: bool = field(default=False, repr=False, compare=False)
+    selected_folder_meta: dict[str, Any] | None = field(
+        default=None, repr=False, compare=False
+    )
     connected_at: datetime = field(default_factory=datetime.now)
     last_activity: datetime = field(default_factory=datetime.now)
     state: SessionState = SessionState.CONNECTING
     retry_count: int = 0
+    on_activity: Callable[["IMAPSessionInfo"], None] | None = field(
+        default=None, repr=False, compare=False
+    )
+    account_key: str = field(init=False, repr=False, compare=False)
+    def __post_init__(self) -> None:
+        """Derive the case-insensitive account key from email."""
+        self.account_key = sys.intern(self.email.lower())
     def update_activity(self) -> None:
-        """Update last_activity timestamp to current time."""
+        """Update last_activity timestamp and notify the owning authenticator."""
         self.last_activity = datetime.now()
+        if self.on_activity is not None:
+            self.on_activity(self)
     def is_stale(self, timeout_minutes: int = 25) -> bool:
         """Check if session is stale (no activity beyond timeout).
         Args:
@@ -368,7 +574,20 @@ class IMAPAuthenticator:
     - Hostname validation enabled
     - Certificate validation cannot be disabled for security
     Attributes:
-        _sessions: Dictionary mapping session_id to IMAPSessionInfo
+        _sessions: Weak mapping of session_id to IMAPSessionInfo; entries vanish
+            once nothing else references the session
+        _pinned: Strong references to sessions holding a live IMAP connection,
+            released in disconnect()
+        _sessions_by_email: Per-account LRU (keyed by IMAPSessionInfo.account_key)
+            of established sessions (least recently active first), used to
+            pick the session to evict at the limit
+        _pool: Per-account deque (keyed by IMAPCredentials.key) of
+            (password digest, IMAPClient, pooled-at _now() time) for logged-in
+            connections released by disconnect(), reused by authenticate()
+            when the password digest matches and the entry is younger than
+            POOL_MAX_AGE_SECONDS; close_all() logs them all out
+        _session_pool_keys: (account key, password digest) of each tracked
+            session, used to file its connection in _pool on disconnect
         _logger: Logger instance for IMAP operations
         _server: IMAP server address (default: imap.gmail.com)
         _port: IMAP server port (default: 993 for SSL/TLS)
@@ -383,16 +602,36 @@ class IMAPAuthenticator:
             server: IMAP server address (default: imap.gmail.com)
             port: IMAP server port (default: 993 for SSL)
         """
-        self._sessions: dict[uuid.UUID, IMAPSessionInfo] = {}
+        self._sessions: weakref.WeakValueDictionary[uuid.UUID, IMAPSessionInfo] = (
+            weakref.WeakValueDictionary()
+        )
+        self._pinned: dict[uuid.UUID, IMAPSessionInfo] = {}
+        self._sessions_by_email: dict[str, OrderedDict[uuid.UUID, IMAPSessionInfo]] = {}
         self._logger = logger
         self._server = server
         self._port = port
         # Warn if server is not a Gmail domain
         self._warn_if_not_gmail(server)
-        # Rate limiting for authentication attempts
-        self._failed_attempts: defaultdict[str, list[datetime]] = defaultdict(list)
-        self._lockout_until: dict[str, datetime] = {}
+        # Rate limiting for authentication attempts (time.monotonic() seconds;
+        # _now is swappable so tests can time-travel)
+        self._now: Callable[[], float] = time.monotonic
+        self._failed_attempts: defaultdict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=MAX_TRACKED_FAILURES)
+        )
+        self._lockout_until: dict[str, float] = {}
+        # Min-heap of (expiry, email) so expired lockouts are purged in
+        # O(log n) each; entries superseded in _lockout_until are skipped
+        self._lockout_heap: list[tuple[float, str]] = []
+        # Logins admitted by _check_rate_limit that have not finished yet
+        self._attempts_in_flight: Counter[str] = Counter()
+        self._rl_lock = threading.Lock()
         self._cleanup_lock = threading.Lock()
+        # Connection pool; digests are keyed by a per-instance random secret
+        # so pooled entries never hold anything derivable offline
+        self._pool: dict[str, deque[tuple[bytes, IMAPClient, float]]] = {}
+        self._session_pool_keys: dict[uuid.UUID, tuple[str, bytes]] = {}
+        self._pool_key = secrets.token_bytes(32)
+        self._pool_lock = threading.Lock()
                 # Start background cleanup thread
         self._start_cleanup_thread()
         self._logger.info(
@@ -420,13 +659,35 @@ class IMAPAuthenticator:
         """
         # Validate credentials (will raise ValueError if invalid)
         self._validate_credentials(credentials)
-        # Check rate limiting before attempting authentication
-        self._check_rate_limit(credentials.email)
+        # Check rate limiting before attempting authentication; this reserves
+        # an attempt slot that is released once the login attempt finishes.
+        # Keyed case-insensitively so varying the email's case cannot dodge it
+        self._check_rate_limit(credentials.key)
+        try:
+            return self._authenticate_with_retry(credentials)
+        finally:
+            self._release_attempt_slot(credentials.key)
+    def _authenticate_with_retry(self, credentials: IMAPCredentials) -> IMAPSessionInfo:
+        """Connect and log in, retrying transient network failures.
+        Args:
+            credentials: Validated, rate-limit-admitted credentials
+        Returns:
+            IMAPSessionInfo for the authenticated session
+        Raises:
+            IMAPAuthenticationError: Authentication failed (invalid credentials)
+            IMAPConnectionError: Connection failed after retries
+        """
         # Create session info
         session_info = IMAPSessionInfo(
             email=credentials.email,
             state=SessionState.CONNECTING,
         )
+        # Reuse a pooled, still-live connection for the same credentials
+        # to skip the TCP+TLS handshake and LOGIN
+        digest = self._password_digest(credentials)
+        pooled_client = self._checkout_pooled_connection(credentials.key, digest)
+        if pooled_client is not None:
+            return self._register_session(session_info, pooled_client, credentials, digest, 0)
         max_retries = 5
         for attempt in range(max_retries):
             try:
@@ -477,7 +738,8 @@ class IMAPAuthenticator:
                         raise IMAPAuthenticationError(
                             f"Authentication failed for {credentials.email}. "
                             f"Please check your credentials and ensure IMAP is enabled "
-                            f"in Gmail settings. If using 2FA, generate an app password."
+                            f"in Gmail settings. If using 2FA, generate an app password.",
+                            code=ErrorCode.BAD_CREDENTIALS,
                         ) from e
                     else:
                         raise IMAPAuthenticationError(
@@ -485,49 +747,12 @@ class IMAPAuthenticator:
                         ) from e
                 # Verify connection with NOOP
                 client.noop()
-
-                # Clear failed attempts on successful authentication
-                if credentials.email in self._failed_attempts:
-                    del self._failed_attempts[credentials.email]
-                if credentials.email in self._lockout_until:
-                    del self._lockout_until[credentials.email]
-                # Update session info
-                session_info.connection = client
-                session_info.state = SessionState.CONNECTED
-                session_info.connected_at = datetime.now()
-                session_info.last_activity = datetime.now()
-                session_info.retry_count = attempt
-                # Update credentials last_used
-                credentials.last_used = datetime.now()
-                # Check session limit for this email
-                with self._cleanup_lock:
-                    active_sessions = [
-                        s for s in self._sessions.values()
-                        if s.email == credentials.email and s.state == SessionState.CONNECTED
-                    ]
-                    if len(active_sessions) >= MAX_SESSIONS_PER_EMAIL:
-                        # Disconnect oldest session
-                        oldest = min(active_sessions, key=lambda s: s.connected_at)
-                        hashed_email = self._hash_email(credentials.email)
-                        self._logger.warning(
-                            f"Session limit ({MAX_SESSIONS_PER_EMAIL}) reached for user {hashed_email}. "
-                            f"Disconnecting oldest session: {oldest.session_id}"
-                        )
-                        try:
-                            self.disconnect(oldest.session_id)
-                        except Exception as e:
-                            self._logger.error(f"Failed to disconnect oldest session: {self._sanitize_error(e)}")
-                # Store session
-                with self._cleanup_lock:
-                    self._sessions[session_info.session_id] = session_info
-                hashed_email = self._hash_email(credentials.email)
-                self._logger.info(
-                    f"Session created: {session_info.session_id} for user {hashed_email}"
+                return self._register_session(
+                    session_info, client, credentials, digest, attempt
                 )
-                return session_info
             except IMAPAuthenticationError:
                 # Record failed authentication attempt
-                self._failed_attempts[credentials.email].append(datetime.now())
+                self._record_failed_attempt(credentials.key)
                 # Don't retry authentication errors - invalid credentials
                 raise
             except (OSError, TimeoutError) as e:
@@ -559,18 +784,189 @@ class IMAPAuthenticator:
                 raise IMAPConnectionError(f"Unexpected error: {e}") from e
         # Should never reach here, but for type safety
         raise IMAPConnectionError("Authentication failed: max retries exceeded")
-    def disconnect(self, session_id: uuid.UUID) -> None:
+    def _register_session(
+        self,
+        session_info: IMAPSessionInfo,
+        client: IMAPClient,
+        credentials: IMAPCredentials,
+        digest: bytes,
+        attempt: int,
+    ) -> IMAPSessionInfo:
+        """Mark a logged-in connection as a new session and start tracking it.
+        Args:
+            session_info: Session being established
+            client: Authenticated, NOOP-verified connection
+            credentials: Credentials the connection is logged in with
+            digest: Password digest (see _password_digest) for pooling
+            attempt: Number of connection retries it took
+        Returns:
+            session_info, now CONNECTED
+        """
+        # Clear failed attempts on successful authentication
+        with self._rl_lock:
+            self._failed_attempts.pop(credentials.key, None)
+            self._lockout_until.pop(credentials.key, None)
+        # Update session info
+        session_info.connection = client
+        session_info.state = SessionState.CONNECTED
+        session_info.connected_at = datetime.now()
+        session_info.last_activity = datetime.now()
+        session_info.retry_count = attempt
+        # Update credentials last_used
+        credentials.last_used = datetime.now()
+        # Enforce session limit for this email by evicting the least
+        # recently active session, then store the new one
+        with self._cleanup_lock:
+            bucket = self._sessions_by_email.get(credentials.key)
+            if bucket is not None and len(bucket) >= MAX_SESSIONS_PER_EMAIL:
+                oldest_id, _ = bucket.popitem(last=False)
+                hashed_email = self._hash_email(credentials.email)
+                self._logger.warning(
+                    f"Session limit ({MAX_SESSIONS_PER_EMAIL}) reached for user {hashed_email}. "
+                    f"Disconnecting least recently active session: {oldest_id}"
+                )
+                try:
+                    # Evicted to cap open connections, so log out, don't pool
+                    self.disconnect(oldest_id, reuse=False)
+                except Exception as e:
+                    self._logger.error(f"Failed to disconnect oldest session: {self._sanitize_error(e)}")
+            self._track_session(session_info)
+            self._session_pool_keys[session_info.session_id] = (credentials.key, digest)
+        hashed_email = self._hash_email(credentials.email)
+        self._logger.info(
+            f"Session created: {session_info.session_id} for user {hashed_email}"
+        )
+        return session_info
+    def _password_digest(self, credentials: IMAPCredentials) -> bytes:
+        """Keyed digest identifying the password a pooled connection logged in with.
+        Args:
+            credentials: Credentials being authenticated
+        Returns:
+            HMAC-SHA256 of the password under this authenticator's pool key
+        """
+        return hmac.digest(self._pool_key, credentials._password_bytes, "sha256")
+    def _checkout_pooled_connection(self, key: str, digest: bytes) -> IMAPClient | None:
+        """Take a live pooled connection logged in with the same password.
+        Connections that are too old, were logged in with another password or
+        fail NOOP are logged out (best effort) and dropped.
+        Args:
+            key: Account key (IMAPCredentials.key) being authenticated
+            digest: Password digest of the credentials being authenticated
+        Returns:
+            A verified connection, or None if the caller must log in afresh
+        """
+        while True:
+            with self._pool_lock:
+                pool = self._pool.get(key)
+                if not pool:
+                    return None
+                pooled_digest, client, pooled_at = pool.pop()
+                if not pool:
+                    del self._pool[key]
+            if self._now() - pooled_at >= POOL_MAX_AGE_SECONDS:
+                self._logout_quietly(client)
+                continue
+            if not hmac.compare_digest(pooled_digest, digest):
+                # Password changed since the connection was pooled
+                self._logout_quietly(client)
+                continue
+            try:
+                client.noop()
+            except Exception as e:
+                self._logger.debug(f"Dropping dead pooled connection: {self._sanitize_error(e)}")
+                self._logout_quietly(client)
+                continue
+            self._logger.info(f"Reusing pooled connection for user {self._hash_email(key)}")
+            return client
+    def _release_to_pool(self, key: str, digest: bytes, client: IMAPClient) -> bool:
+        """Keep a logged-in connection for reuse if the account's pool has room.
+        Args:
+            key: Account key (IMAPCredentials.key) the connection is logged in as
+            digest: Password digest of the session
+            client: Connection with no folder selected
+        Returns:
+            True if the connection was pooled, False if the caller must log out
+        """
+        expired = self._prune_pool(key)
+        try:
+            with self._pool_lock:
+                pool = self._pool.setdefault(key, deque())
+                if len(pool) >= POOL_MAX_CONNECTIONS:
+                    return False
+                pool.append((digest, client, self._now()))
+                return True
+        finally:
+            for stale_client in expired:
+                self._logout_quietly(stale_client)
+    def _prune_pool(self, key: str | None = None) -> list[IMAPClient]:
+        """Remove pooled connections older than POOL_MAX_AGE_SECONDS.
+        Entries are appended in time order, so expired ones sit at the left
+        of each deque. The caller logs out the returned connections outside
+        _pool_lock.
+        Args:
+            key: Only prune this account's pool (default: every account)
+        Returns:
+            Expired connections, already removed from the pool
+        """
+        cutoff = self._now() - POOL_MAX_AGE_SECONDS
+        expired: list[IMAPClient] = []
+        with self._pool_lock:
+            keys = list(self._pool) if key is None else [key]
+            for pool_key in keys:
+                pool = self._pool.get(pool_key)
+                if pool is None:
+                    continue
+                while pool and pool[0][2] <= cutoff:
+                    expired.append(pool.popleft()[1])
+                if not pool:
+                    del self._pool[pool_key]
+        return expired
+    def close_all(self) -> None:
+        """Disconnect every session and log out every pooled connection.
+        disconnect() keeps connections logged in for reuse, so call this
+        before the process exits to send LOGOUT for all of them.
+        """
+        for session_id in list(self._sessions.keys()):
+            try:
+                self.disconnect(session_id, reuse=False)
+            except ValueError:
+                # Already disconnected by another thread
+                pass
+        with self._pool_lock:
+            pooled = [client for pool in self._pool.values() for _, client, _ in pool]
+            self._pool.clear()
+        for client in pooled:
+            self._logout_quietly(client)
+        if pooled:
+            self._logger.info(f"Logged out {len(pooled)} pooled connections")
+    def _logout_quietly(self, client: IMAPClient) -> None:
+        """Log out a connection, ignoring errors from an already-dead socket.
+        Args:
+            client: Connection to log out
+        """
+        try:
+            client.logout()
+        except Exception as e:
+            self._logger.debug(f"Error logging out connection: {self._sanitize_error(e)}")
+    def disconnect(self, session_id: uuid.UUID, reuse: bool = True) -> None:
         """Disconnect IMAP session and cleanup.
-        Logs out from IMAP server, closes connection, and removes session
-        from active sessions dictionary.
+        Closes the selected folder and, if reuse is set, returns the logged-in
+        connection to the account's pool for reuse by authenticate(); if the
+        pool is full or the folder cannot be closed, logs out from the IMAP
+        server instead. The session is removed from the active sessions
+        dictionary either way. Use close_all() to log out pooled connections.
         Args:
             session_id: UUID of the session to disconnect
+            reuse: Pool the connection instead of logging out (default: True)
         Raises:
             ValueError: Session ID not found
         """
-        if session_id not in self._sessions:
+        session_info = self._sessions.get(session_id)
+        if session_info is None:
             raise ValueError(f"Session {session_id} not found")
-        session_info = self._sessions[session_id]
+        pool_entry = self._session_pool_keys.pop(session_id, None)
+        if not reuse:
+            pool_entry = None
         try:
             if session_info.connection:
                 # Close selected mailbox if any
@@ -579,20 +975,31 @@ class IMAPAuthenticator:
                         session_info.connection.close_folder()
                     except Exception as e:
                         self._logger.warning(f"Error closing folder: {self._sanitize_error(e)}")
-                # Logout from IMAP server
-                try:
-                    session_info.connection.logout()
+                        # Folder state is unknown; don't hand this connection out again
+                        pool_entry = None
+                if pool_entry is not None and self._release_to_pool(
+                    *pool_entry, session_info.connection
+                ):
                     self._logger.info(
-                        f"Logged out from IMAP server for session {session_id}"
+                        f"Returned connection to pool for session {session_id}"
                     )
-                except Exception as e:
-                    self._logger.warning(f"Error during logout: {self._sanitize_error(e)}")
+                else:
+                    # Logout from IMAP server
+                    try:
+                        session_info.connection.logout()
+                        self._logger.info(
+                            f"Logged out from IMAP server for session {session_id}"
+                        )
+                    except Exception as e:
+                        self._logger.warning(f"Error during logout: {self._sanitize_error(e)}")
             # Update session state
             session_info.state = SessionState.DISCONNECTED
             session_info.connection = None
         finally:
-            # Always remove from sessions dict
-            del self._sessions[session_id]
+            # Always remove from sessions dict and drop the pinned reference
+            self._sessions.pop(session_id, None)
+            self._pinned.pop(session_id, None)
+            self._untrack_from_bucket(session_info)
             self._logger.info(f"Session {session_id} disconnected and removed")
     def is_alive(self, session_id: uuid.UUID) -> bool:
         """Check if IMAP session is alive and responsive.
@@ -653,13 +1060,55 @@ class IMAPAuthenticator:
             IMAPSessionInfo if found, None otherwise
         """
         return self._sessions.get(session_id)
+    def _track_session(self, session_info: IMAPSessionInfo) -> None:
+        """Register an established session and pin it while connected.
+        Adds the session to the weak session map, the pinned set and the
+        most-recent end of its email's LRU bucket. Caller holds _cleanup_lock.
+        Args:
+            session_info: Session to register
+        """
+        session_id = session_info.session_id
+        self._sessions[session_id] = session_info
+        self._pinned[session_id] = session_info
+        bucket = self._sessions_by_email.setdefault(session_info.account_key, OrderedDict())
+        bucket[session_id] = session_info
+        session_info.on_activity = self._touch
+    def _untrack_from_bucket(self, session_info: IMAPSessionInfo) -> None:
+        """Remove a session from its email's LRU bucket, dropping empty buckets.
+        Args:
+            session_info: Session to remove
+        """
+        bucket = self._sessions_by_email.get(session_info.account_key)
+        if bucket is None:
+            return
+        bucket.pop(session_info.session_id, None)
+        if not bucket:
+            self._sessions_by_email.pop(session_info.account_key, None)
+    def _touch(self, session_info: IMAPSessionInfo) -> None:
+        """Mark a session as most recently active in its email's LRU bucket.
+        Called from IMAPSessionInfo.update_activity(); move_to_end is O(1).
+        Runs without _cleanup_lock, so eviction or disconnect may remove the
+        session concurrently; a session that is already gone is ignored.
+        Args:
+            session_info: Session that just saw activity
+        """
+        bucket = self._sessions_by_email.get(session_info.account_key)
+        if bucket is not None:
+            with contextlib.suppress(KeyError):
+                bucket.move_to_end(session_info.session_id)
     def _start_cleanup_thread(self) -> None:
         """Start background thread for automatic session cleanup."""
         def cleanup_worker():
             while True:
                 time.sleep(CLEANUP_INTERVAL_SECONDS)
                 try:
-                    self._cleanup_stale_sessions()
+                    stats = self._cleanup_and_stats()
+                    self._logger.debug(
+                        f"Session stats before cleanup: "
+                        f"total={stats['total_sessions']}, "
+                        f"active={stats['active_sessions']}, "
+                        f"stale={stats['stale_sessions']}"
+                    )
                 except Exception as e:
                     self._logger.error(f"Error in cleanup thread: {self._sanitize_error(e)}")
         cleanup_thread = threading.Thread(
@@ -671,28 +1120,67 @@ class IMAPAuthenticator:
         self._logger.info("Started IMAP session cleanup thread")
     def _cleanup_stale_sessions(self) -> None:
         """Remove and disconnect stale sessions."""
+        self._cleanup_and_stats()
+    def _scan_sessions(self) -> tuple[dict, list[uuid.UUID]]:
+        """Collect session statistics and stale session IDs in one pass.
+        Caller must hold _cleanup_lock.
+        Returns:
+            Tuple of (statistics dict as returned by get_session_stats,
+            list of stale session IDs)
+        """
+        cutoff = datetime.now() - timedelta(minutes=STALE_TIMEOUT_MINUTES)
+        total = 0
+        active = 0
+        stale_sessions: list[uuid.UUID] = []
+        sessions_by_email: Counter[str] = Counter()
+        for session_info in self._sessions.values():
+            total += 1
+            sessions_by_email[session_info.email] += 1
+            if session_info.state is SessionState.CONNECTED:
+                active += 1
+            if session_info.last_activity < cutoff:
+                stale_sessions.append(session_info.session_id)
+        stats = {
+            "total_sessions": total,
+            "active_sessions": active,
+            "stale_sessions": len(stale_sessions),
+            "sessions_by_email": dict(sessions_by_email),
+        }
+        return stats, stale_sessions
+    def _cleanup_and_stats(self) -> dict:
+        """Disconnect stale sessions and return statistics from the same pass.
+        Also logs out pooled connections older than POOL_MAX_AGE_SECONDS.
+        Returns:
+            Session statistics (see get_session_stats) as observed before the
+            stale sessions were removed
+        """
         with self._cleanup_lock:
-            stale_sessions = [
-                session_id
-                for session_id, session_info in self._sessions.items()
-                if session_info.is_stale(timeout_minutes=STALE_TIMEOUT_MINUTES)
-            ]
+            stats, stale_sessions = self._scan_sessions()
             for session_id in stale_sessions:
                 try:
                     self._logger.warning(
                         f"Auto-cleaning stale session: {session_id}"
                     )
-                    self.disconnect(session_id)
+                    # Stale connections are likely dead server-side; don't pool
+                    self.disconnect(session_id, reuse=False)
                 except Exception as e:
                     self._logger.error(
                         f"Failed to cleanup session {session_id}: {e}"
                     )
                     # Force removal even if disconnect fails
-                    self._sessions.pop(session_id, None)
+                    session_info = self._sessions.pop(session_id, None)
+                    self._pinned.pop(session_id, None)
+                    self._session_pool_keys.pop(session_id, None)
+                    if session_info is not None:
+                        self._untrack_from_bucket(session_info)
             if stale_sessions:
                 self._logger.info(
                     f"Cleaned up {len(stale_sessions)} stale sessions"
                 )
+        # Log out pooled connections nobody reused within POOL_MAX_AGE_SECONDS
+        for client in self._prune_pool():
+            self._logout_quietly(client)
+        return stats
     def get_session_stats(self) -> dict:
         """Get session statistics for monitoring.
         Returns:
@@ -703,25 +1191,8 @@ class IMAPAuthenticator:
             - sessions_by_email: Number of sessions per email address
         """
         with self._cleanup_lock:
-            active = sum(
-                1 for s in self._sessions.values()
-                if s.state == SessionState.CONNECTED
-            )
-            stale = sum(
-                1 for s in self._sessions.values()
-                if s.is_stale(timeout_minutes=STALE_TIMEOUT_MINUTES)
-            )
-            # Count sessions by email
-            sessions_by_email: dict[str, int] = {}
-            for session_info in self._sessions.values():
-                email = session_info.email
-                sessions_by_email[email] = sessions_by_email.get(email, 0) + 1
-            return {
-                "total_sessions": len(self._sessions),
-                "active_sessions": active,
-                "stale_sessions": stale,
-                "sessions_by_email": sessions_by_email,
-            }
+            stats, _ = self._scan_sessions()
+            return stats
     def _validate_credentials(self, credentials: IMAPCredentials) -> None:
         """Validate credentials format and constraints.
         Credentials dataclass already validates email format and password security
@@ -789,38 +1260,90 @@ class IMAPAuthenticator:
     def _check_rate_limit(self, email: str) -> None:
         """Check and enforce rate limiting for authentication attempts.
         Tracks failed authentication attempts per email and implements exponential
-        lockout after 5 failures within 15 minutes.
+        lockout after 5 failures within 15 minutes. An admitted call reserves an
+        in-flight attempt slot, which the caller must release with
+        _release_attempt_slot(), so concurrent logins cannot all pass the check
+        before any of their failures are recorded.
         Args:
-            email: Email address to check rate limit for
+            email: Rate-limiting key (IMAPCredentials.key) to check
         Raises:
-            IMAPAuthenticationError: User is locked out due to excessive failed attempts
+            IMAPAuthenticationError: User is locked out due to excessive failed attempts,
+                or too many attempts for this email are already in progress
         Rate limiting policy:
         - Track failures within 15-minute window
         - After 5 failures: exponential lockout (2^(n-4) minutes, max 64 minutes)
         - Lockout durations: 5 failures=2min, 6=4min, 7=8min, ..., 10+=64min
+        - Recorded failures plus in-flight attempts never exceed 5
         """
-        now = datetime.now()
-        # Check if user is currently locked out
-        if email in self._lockout_until and now < self._lockout_until[email]:
-            remaining = (self._lockout_until[email] - now).total_seconds()
-            raise IMAPAuthenticationError(
-                f"Too many failed authentication attempts. Try again in {int(remaining)} seconds."
-            )
-        # Clean old attempts (older than 15 minutes)
-        cutoff = now - timedelta(minutes=15)
-        self._failed_attempts[email] = [
-            attempt for attempt in self._failed_attempts[email] if attempt > cutoff
-        ]
-        # Check if user has exceeded failure threshold
-        if len(self._failed_attempts[email]) >= 5:
-            # Calculate exponential lockout duration (2^(n-4) minutes, capped at 64)
-            lockout_minutes = 2 ** min(len(self._failed_attempts[email]) - 4, 6)
-            self._lockout_until[email] = now + timedelta(minutes=lockout_minutes)
-            self._logger.warning(
-                f"Rate limit exceeded for {email}. "
-                f"Locked out for {lockout_minutes} minutes. "
-                f"({len(self._failed_attempts[email])} failed attempts)"
-            )
-            raise IMAPAuthenticationError(
-                f"Too many failed authentication attempts. Locked out for {lockout_minutes} minutes."
-            )
+        with self._rl_lock:
+            now = self._now()
+            # Forget expired lockouts for every email, not just this one
+            heap = self._lockout_heap
+            while heap and heap[0][0] <= now:
+                expiry, expired_email = heapq.heappop(heap)
+                if self._lockout_until.get(expired_email) == expiry:
+                    del self._lockout_until[expired_email]
+            # Check if user is currently locked out
+            lockout_until = self._lockout_until.get(email)
+            if lockout_until is not None and now < lockout_until:
+                remaining = math.ceil(lockout_until - now)
+                raise IMAPAuthenticationError(
+                    f"Too many failed authentication attempts. Try again in {remaining} seconds.",
+                    code=ErrorCode.LOCKED_OUT,
+                    retry_after_seconds=remaining,
+                )
+            failures = 0
+            attempts = self._failed_attempts.get(email)
+            if attempts:
+                # Drop attempts older than the window (timestamps are in append
+                # order, so if the newest has expired they all have)
+                cutoff = now - RATE_LIMIT_WINDOW_SECONDS
+                if attempts[-1] <= cutoff:
+                    del self._failed_attempts[email]
+                else:
+                    while attempts[0] <= cutoff:
+                        attempts.popleft()
+                    failures = len(attempts)
+            # Check if user has exceeded failure threshold
+            lockout_seconds = _LOCKOUT_SECONDS[min(failures, len(_LOCKOUT_SECONDS) - 1)]
+            if lockout_seconds:
+                lockout_minutes = lockout_seconds // 60
+                expiry = now + lockout_seconds
+                self._lockout_until[email] = expiry
+                heapq.heappush(heap, (expiry, email))
+                self._logger.warning(
+                    f"Rate limit exceeded for {email}. "
+                    f"Locked out for {lockout_minutes} minutes. "
+                    f"({failures} failed attempts)"
+                )
+                raise IMAPAuthenticationError(
+                    f"Too many failed authentication attempts. Locked out for {lockout_minutes} minutes.",
+                    code=ErrorCode.LOCKED_OUT,
+                    retry_after_seconds=lockout_seconds,
+                )
+            # Admit only as many concurrent attempts as failures remain allowed
+            in_flight = self._attempts_in_flight[email]
+            if failures + in_flight >= RATE_LIMIT_MAX_FAILURES:
+                raise IMAPAuthenticationError(
+                    "Too many authentication attempts in progress. Try again shortly.",
+                    code=ErrorCode.RATE_LIMITED,
+                )
+            self._attempts_in_flight[email] = in_flight + 1
+    def _record_failed_attempt(self, email: str) -> None:
+        """Record a failed login for email at the current monotonic time.
+        Args:
+            email: Rate-limiting key (IMAPCredentials.key) whose login failed
+        """
+        with self._rl_lock:
+            self._failed_attempts[email].append(self._now())
+    def _release_attempt_slot(self, email: str) -> None:
+        """Release the in-flight slot reserved by _check_rate_limit().
+        Args:
+            email: Rate-limiting key (IMAPCredentials.key) whose attempt finished
+        """
+        with self._rl_lock:
+            remaining = self._attempts_in_flight[email] - 1
+            if remaining > 0:
+                self._attempts_in_flight[email] = remaining
+            else:
+                del self._attempts_in_flight[email]
@@ -414,8 +414,8 @@ def login(imap, email):
                 credentials.clear_password()  # Clear from memory after storage
                 credentials.clear_password()  # Clear from memory after storage
 
-            # Disconnect test session
-            authenticator.disconnect(session.session_id)
+            # Disconnect test session and log out (nothing reuses the pool after exit)
+            authenticator.close_all()
 
             click.echo()
             click.echo("You can now use gmail-classifier with IMAP!")
@@ -524,8 +524,8 @@ def auth_status(email):
                 click.echo(f"    Session ID: {session.session_id}")
                 click.echo(f"    Connected at: {session.connected_at.strftime('%Y-%m-%d %H:%M:%S')}")
 
-                # Disconnect test session
-                authenticator.disconnect(session.session_id)
+                # Disconnect test session and log out (nothing reuses the pool after exit)
+                authenticator.close_all()
                 # Clear password from memory
                 creds.clear_password()
                 # Clear password from memory
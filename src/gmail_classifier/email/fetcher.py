@@ -12,12 +12,18 @@ AIDEV-NOTE: X-GM-LABELS extension
 """
 
 import email.errors
+import functools
 import logging
+import time
 import uuid
+from collections.abc import Collection, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, TypedDict, cast
 
+from imapclient.exceptions import IMAPClientError
+from imapclient.imapclient import as_pairs, parse_response
+
 from gmail_classifier.auth.imap import IMAPSessionError
 from gmail_classifier.auth.protocols import IMAPAuthProtocol
 from gmail_classifier.models.email import Email
@@ -51,10 +57,14 @@ IMAPFetchData = TypedDict('IMAPFetchData', {
 # ============================================================================
 
 
-@dataclass
+@dataclass(frozen=True)
 class EmailFolder:
     """Represents an IMAP mailbox folder (Gmail label).
 
+    Frozen because parsed folders are cached and shared across sessions and
+    accounts (see _parse_folder_entry); use dataclasses.replace() to derive
+    a folder with counts filled in.
+
     Attributes:
         folder_name: IMAP folder name (e.g., "INBOX", "[Gmail]/Sent Mail")
         display_name: Human-readable folder name
@@ -117,19 +127,86 @@ class EmailFolder:
         )
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_folder_entry(
+    flags: tuple[bytes, ...], delimiter: bytes, name: str
+) -> EmailFolder:
+    """Parse one IMAP LIST entry, memoized on the raw entry.
+
+    Gmail folder names rarely change between listings, so re-fetches reuse
+    the already-decoded EmailFolder. Sharing is safe across sessions and
+    accounts because EmailFolder is frozen.
+
+    Args:
+        flags: IMAP flags tuple
+        delimiter: Hierarchy delimiter
+        name: Folder name
+
+    Returns:
+        Cached EmailFolder instance
+    """
+    return EmailFolder.from_imap_response(flags, delimiter, name)
+
+
+def _compress_message_ids(message_ids: Sequence[int]) -> str:
+    """Encode message IDs as a compact IMAP sequence set.
+
+    Runs of consecutive IDs collapse to "start:end", so a SEARCH result for a
+    mostly contiguous mailbox becomes a handful of ranges rather than one
+    comma-separated number per message. Order is preserved; only adjacent
+    ascending runs are merged.
+
+    Args:
+        message_ids: Message sequence numbers or UIDs
+
+    Returns:
+        Sequence set, e.g. "1:3,5:6,10" for [1, 2, 3, 5, 6, 10]
+    """
+    if not message_ids:
+        return ""
+    parts: list[str] = []
+    it = iter(message_ids)
+    start = end = next(it)
+    for msg_id in it:
+        if msg_id == end + 1:
+            end = msg_id
+            continue
+        parts.append(f"{start}:{end}" if end != start else str(start))
+        start = end = msg_id
+    parts.append(f"{start}:{end}" if end != start else str(start))
+    return ",".join(parts)
+
+
 @dataclass
 class CacheEntry:
     """Cache entry with time-to-live support.
 
+    Expiry is a monotonic-clock deadline, so checks are a single integer
+    comparison and are unaffected by wall-clock adjustments.
+
     Attributes:
         data: List of cached EmailFolder objects
-        created_at: Timestamp when cache entry was created
-        ttl: Time-to-live duration (default: 10 minutes)
+        deadline_ns: time.monotonic_ns() value after which the entry is stale
     """
 
     data: list[EmailFolder]
-    created_at: datetime
-    ttl: timedelta = timedelta(minutes=10)
+    deadline_ns: int
+
+    @classmethod
+    def fresh(
+        cls, data: list[EmailFolder], ttl: timedelta = timedelta(minutes=10)
+    ) -> "CacheEntry":
+        """Create an entry that expires ttl from now.
+
+        Args:
+            data: Folders to cache
+            ttl: Time-to-live duration (default: 10 minutes)
+
+        Returns:
+            New CacheEntry
+        """
+        ttl_ns = (ttl // timedelta(microseconds=1)) * 1_000
+        return cls(data=data, deadline_ns=time.monotonic_ns() + ttl_ns)
 
     def is_stale(self) -> bool:
         """Check if cache entry has exceeded its TTL.
@@ -137,7 +214,7 @@ class CacheEntry:
         Returns:
             True if entry is stale and should be refreshed
         """
-        return datetime.now() - self.created_at > self.ttl
+        return time.monotonic_ns() > self.deadline_ns
 
 
 # ============================================================================
@@ -169,7 +246,9 @@ class FolderManager:
 
         self._logger.info("FolderManager initialized")
 
-    def list_folders(self, session_id: uuid.UUID) -> list[EmailFolder]:
+    def list_folders(
+        self, session_id: uuid.UUID, names: Collection[str] | None = None
+    ) -> list[EmailFolder]:
         """List all IMAP folders (Gmail labels) for the session.
 
         Retrieves and parses folder list from IMAP server. Results are cached
@@ -177,6 +256,8 @@ class FolderManager:
 
         Args:
             session_id: UUID of active IMAP session
+            names: Optional folder names to keep; others are filtered out
+                (server order is preserved, unknown names are ignored)
 
         Returns:
             List of EmailFolder objects
@@ -190,7 +271,7 @@ class FolderManager:
             cache_entry = self._folder_cache[session_id]
             if not cache_entry.is_stale():
                 self._logger.debug(f"Returning cached folders for session {session_id}")
-                return cache_entry.data
+                return self._filter_folders(cache_entry.data, names)
             else:
                 self._logger.debug(f"Cache stale for session {session_id}, refreshing")
 
@@ -203,36 +284,60 @@ class FolderManager:
             # List folders using IMAP
             raw_folders = session_info.connection.list_folders()
 
-            # Parse into EmailFolder objects
-            folders = []
-            for flags, delimiter, name in raw_folders:
-                folder = EmailFolder.from_imap_response(flags, delimiter, name)
-                folders.append(folder)
+            # Parse into EmailFolder objects (memoized per raw LIST entry)
+            folders = [
+                _parse_folder_entry(tuple(flags), delimiter, name)
+                for flags, delimiter, name in raw_folders
+            ]
 
-            # Cache results with timestamp
-            self._folder_cache[session_id] = CacheEntry(
-                data=folders,
-                created_at=datetime.now()
-            )
+            # Cache results with expiry deadline
+            self._folder_cache[session_id] = CacheEntry.fresh(folders)
 
             self._logger.info(
                 f"Listed {len(folders)} folders for session {session_id}"
             )
-            return folders
+            return self._filter_folders(folders, names)
 
         except (OSError, UnicodeDecodeError, email.errors.MessageError) as e:
             self._logger.error(f"Failed to list folders: {e}")
             raise IMAPSessionError(f"Failed to list folders: {e}") from e
 
+    @staticmethod
+    def _filter_folders(
+        folders: list[EmailFolder], names: Collection[str] | None
+    ) -> list[EmailFolder]:
+        """Keep only folders whose name is in names (single set lookup each).
+
+        Args:
+            folders: Folders in server order
+            names: Folder names to keep, or None to keep all
+
+        Returns:
+            Filtered list (the original list when names is None)
+        """
+        if names is None:
+            return folders
+        wanted = frozenset(names)
+        return [folder for folder in folders if folder.folder_name in wanted]
+
     def select_folder(
-        self, session_id: uuid.UUID, folder_name: str, readonly: bool = False
+        self,
+        session_id: uuid.UUID,
+        folder_name: str,
+        readonly: bool = False,
+        force: bool = False,
     ) -> dict[str, Any]:
         """Select an IMAP folder for operations.
 
+        Re-selecting the folder that is already selected (in the same mode)
+        skips the SELECT round-trip and returns the metadata cached on the
+        session; pass force=True to re-open it and refresh the counts.
+
         Args:
             session_id: UUID of active IMAP session
             folder_name: Folder name to select (e.g., "INBOX")
             readonly: Open folder in read-only mode (default: False)
+            force: Always issue SELECT, even if already selected (default: False)
 
         Returns:
             Dict with folder metadata:
@@ -249,14 +354,25 @@ class FolderManager:
         if not session_info or not session_info.connection:
             raise ValueError(f"No active connection for session {session_id}")
 
+        if (
+            not force
+            and session_info.selected_folder == folder_name
+            and session_info.selected_folder_readonly == readonly
+            and session_info.selected_folder_meta is not None
+        ):
+            self._logger.debug(f"Folder '{folder_name}' already selected, skipping SELECT")
+            session_info.update_activity()
+            return dict(session_info.selected_folder_meta)
+
+        # A failed SELECT leaves no folder selected on the server, whatever
+        # the error, so forget the old selection until this one succeeds
+        session_info.selected_folder = None
+        session_info.selected_folder_meta = None
+
         try:
             # Select folder
             response = session_info.connection.select_folder(folder_name, readonly=readonly)
 
-            # Update session state
-            session_info.selected_folder = folder_name
-            session_info.update_activity()
-
             # Parse response
             metadata = {
                 "message_count": response.get(b"EXISTS", 0),
@@ -264,11 +380,17 @@ class FolderManager:
                 "unread_count": response.get(b"UNSEEN", 0),
             }
 
+            # Update session state
+            session_info.selected_folder = folder_name
+            session_info.selected_folder_readonly = readonly
+            session_info.selected_folder_meta = metadata
+            session_info.update_activity()
+
             self._logger.info(
                 f"Selected folder '{folder_name}' for session {session_id}: "
                 f"{metadata['message_count']} messages"
             )
-            return metadata
+            return dict(metadata)
 
         except (OSError, UnicodeDecodeError, email.errors.MessageError) as e:
             self._logger.error(f"Failed to select folder '{folder_name}': {e}")
@@ -320,6 +442,124 @@ class FolderManager:
             self._logger.error(f"Failed to get folder status for '{folder_name}': {e}")
             raise IMAPSessionError(f"Failed to get folder status: {e}") from e
 
+    def get_folder_statuses(
+        self,
+        session_id: uuid.UUID,
+        folder_names: Sequence[str],
+        pipeline: bool = False,
+    ) -> dict[str, dict[str, Any]]:
+        """Get status for several folders.
+
+        By default this issues one public folder_status() call per folder.
+        With pipeline=True, every STATUS command is sent back-to-back before
+        any reply is read (one round-trip instead of one per folder); that
+        path relies on imaplib's tagged-command internals and is opt-in.
+
+        Args:
+            session_id: UUID of active IMAP session
+            folder_names: Folder names to query
+            pipeline: Pipeline the STATUS commands (default: False)
+
+        Returns:
+            Dict mapping folder name to the get_folder_status() metadata
+
+        Raises:
+            ValueError: Session not found
+            IMAPSessionError: A STATUS command failed
+        """
+        session_info = self._authenticator.get_session(session_id)
+        if not session_info or not session_info.connection:
+            raise ValueError(f"No active connection for session {session_id}")
+        if not folder_names:
+            return {}
+
+        client = session_info.connection
+        imap = getattr(client, "_imap", None) if pipeline else None
+        try:
+            if imap is None:
+                responses = [
+                    client.folder_status(name, ["MESSAGES", "UNSEEN"])
+                    for name in folder_names
+                ]
+            else:
+                responses = self._pipeline_folder_status(client, imap, folder_names)
+
+            session_info.update_activity()
+
+        except (OSError, UnicodeDecodeError, IMAPClientError) as e:
+            self._logger.error(f"Failed to get folder statuses: {e}")
+            raise IMAPSessionError(f"Failed to get folder statuses: {e}") from e
+
+        statuses = {
+            name: {
+                "message_count": response.get(b"MESSAGES", 0),
+                "unread_count": response.get(b"UNSEEN", 0),
+            }
+            for name, response in zip(folder_names, responses, strict=True)
+        }
+        self._logger.debug(f"Folder statuses for {len(statuses)} folders")
+        return statuses
+
+    @staticmethod
+    def _pipeline_folder_status(
+        client: Any, imap: Any, folder_names: Sequence[str]
+    ) -> list[dict[bytes, Any]]:
+        """Send every STATUS command, then drain all tagged replies.
+
+        Every tag that was sent is read back even after a failure (a BAD
+        reply, an abort or a socket error), so the connection is left in
+        sync before the first error is raised.
+
+        Args:
+            client: IMAPClient connection
+            imap: The client's underlying imaplib.IMAP4 object
+            folder_names: Folder names to query
+
+        Returns:
+            STATUS items per folder, in command order
+
+        Raises:
+            IMAPClientError, OSError: Sending or reading a command failed
+            IMAPSessionError: The server did not report OK for every folder
+        """
+        tags = []
+        first_error: Exception | None = None
+        try:
+            for name in folder_names:
+                tags.append(
+                    imap._command(
+                        "STATUS", client._normalise_folder(name), "(MESSAGES UNSEEN)"
+                    )
+                )
+        except (OSError, IMAPClientError) as e:
+            first_error = e
+
+        failed = []
+        for name, tag in zip(folder_names[: len(tags)], tags, strict=True):
+            try:
+                typ, _ = imap._command_complete("STATUS", tag)
+            except (OSError, IMAPClientError) as e:
+                first_error = first_error or e
+                failed.append(name)
+                continue
+            if typ != "OK":
+                failed.append(name)
+        _, lines = imap._untagged_response("OK", [None], "STATUS")
+
+        if first_error is not None:
+            raise first_error
+        if failed:
+            raise IMAPSessionError(f"Failed to get folder status for: {', '.join(failed)}")
+        # Parsed like folder_status() does, so literal and non-ASCII folder
+        # names are handled; replies alternate name, status items in
+        # command order
+        parsed = parse_response(lines)
+        if len(parsed) != 2 * len(folder_names):
+            raise IMAPSessionError(
+                f"Expected {len(folder_names)} STATUS replies, got {len(parsed) // 2}"
+            )
+        return [dict(as_pairs(items)) for items in parsed[1::2]]
+
     def fetch_emails(
         self,
         session_id: uuid.UUID,
@@ -392,7 +632,7 @@ class FolderManager:
                         try:
                             # Fetch sizes first to determine if we need smaller batches
                             size_data = session_info.connection.fetch(
-                                batch_ids, ["RFC822.SIZE"]
+                                _compress_message_ids(batch_ids), ["RFC822.SIZE"]
                             )
 
                             # Calculate average email size
@@ -470,7 +710,9 @@ class FolderManager:
                 "RFC822.SIZE",
             ]
 
-            fetch_data = session_info.connection.fetch(batch_ids, fetch_fields)
+            fetch_data = session_info.connection.fetch(
+                _compress_message_ids(batch_ids), fetch_fields
+            )
 
             # Parse each email
             for msg_id, data in fetch_data.items():
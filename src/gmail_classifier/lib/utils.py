@@ -2,14 +2,15 @@
 
 import os
 import random
+import re
 import stat
 import time
+from collections.abc import Iterable, Iterator
 from functools import wraps
+from itertools import islice
 from pathlib import Path
 from typing import Any, Callable, Optional, TypeVar
 
-from googleapiclient.errors import HttpError
-
 from gmail_classifier.lib.config import gmail_config, privacy_config
 from gmail_classifier.lib.logger import get_logger
 
@@ -18,6 +19,9 @@ logger = get_logger(__name__)
 # Type variable for generic function return type
 T = TypeVar("T")
 
+# Basic email address shape, compiled once for validate_email_address
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
 
 def retry_with_exponential_backoff(
     max_retries: Optional[int] = None,
@@ -44,6 +48,10 @@ def retry_with_exponential_backoff(
         def fetch_data():
             return api.get_data()
     """
+    # Imported here so the lightweight helpers in this module don't pull in
+    # the Google API client
+    from googleapiclient.errors import HttpError
+
     _max_retries = max_retries or gmail_config.max_retries
     _initial_delay = initial_delay or gmail_config.initial_backoff
     _max_delay = max_delay or gmail_config.max_backoff
@@ -160,14 +168,10 @@ def sanitize_email_content(content: str, max_length: int = 500) -> str:
     if not content:
         return ""
 
-    # Truncate to max length
-    sanitized = content[:max_length]
-
-    # Add ellipsis if truncated
-    if len(content) > max_length:
-        sanitized += "..."
-
-    return sanitized
+    # Short content is returned as-is; long content is cut and marked
+    if len(content) <= max_length:
+        return content
+    return content[:max_length] + "..."
 
 
 def format_confidence(confidence: float) -> str:
@@ -221,6 +225,29 @@ def batch_items(items: list[T], batch_size: int) -> list[list[T]]:
     return [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
 
 
+def iter_batches(items: Iterable[T], batch_size: int) -> Iterator[list[T]]:
+    """
+    Lazily yield batches of specified size from any iterable.
+
+    Unlike batch_items, the list of batches is never materialized, so only
+    one batch is held at a time.
+
+    Args:
+        items: Items to batch
+        batch_size: Size of each batch
+
+    Yields:
+        Lists of up to batch_size items, in order
+
+    Example:
+        >>> list(iter_batches(iter([1, 2, 3, 4, 5]), 2))
+        [[1, 2], [3, 4], [5]]
+    """
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
 def validate_email_address(email: str) -> bool:
     """
     Basic email address validation.
@@ -231,10 +258,7 @@ def validate_email_address(email: str) -> bool:
     Returns:
         True if email appears valid, False otherwise
     """
-    import re
-
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def truncate_string(text: str, max_length: int = 100, suffix: str = "...") -> str:
@@ -266,6 +290,9 @@ def safe_int(value: Any, default: int = 0) -> int:
     Returns:
         Integer value or default
     """
+    # Null fields are common in Gmail metadata; skip the exception path for them
+    if value is None or value == "":
+        return default
     try:
         return int(value)
     except (TypeError, ValueError):
@@ -283,6 +310,9 @@ def safe_float(value: Any, default: float = 0.0) -> float:
     Returns:
         Float value or default
     """
+    # Null fields are common in Gmail metadata; skip the exception path for them
+    if value is None or value == "":
+        return default
     try:
         return float(value)
     except (TypeError, ValueError):
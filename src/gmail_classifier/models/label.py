@@ -1,14 +1,42 @@
 """Label entity model."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Optional
 
-
-@dataclass
+# Allowed values for Label.type
+_VALID_TYPES = frozenset(("user", "system"))
+
+# Predefined Gmail system label IDs (CATEGORY_* IDs are matched by prefix)
+_SYSTEM_LABEL_IDS = frozenset(
+    (
+        "INBOX",
+        "SPAM",
+        "TRASH",
+        "UNREAD",
+        "STARRED",
+        "IMPORTANT",
+        "SENT",
+        "DRAFT",
+        "CHAT",
+    )
+)
+
+
+def _label_type(label_id: str) -> str:
+    """Classify a Gmail label ID as "system" or "user"."""
+    if label_id in _SYSTEM_LABEL_IDS or label_id.startswith("CATEGORY_"):
+        return "system"
+    return "user"
+
+
+@dataclass(slots=True, frozen=True)
 class Label:
     """
     Represents a Gmail label (user-created category).
 
+    Immutable and hashable, so labels can be used as set members and dict keys.
+
     Attributes:
         id: Gmail label ID from API
         name: Label display name
@@ -29,7 +57,7 @@ class Label:
             raise ValueError("Label name cannot be empty")
         if self.email_count < 0:
             raise ValueError("Email count cannot be negative")
-        if self.type not in ("user", "system"):
+        if self.type not in _VALID_TYPES:
             raise ValueError(f"Invalid label type: {self.type}. Must be 'user' or 'system'")
 
     @property
@@ -68,25 +96,7 @@ class Label:
 
         # Determine label type based on ID
         # User labels have custom IDs, system labels have predefined IDs
-        system_labels = {
-            "INBOX",
-            "SPAM",
-            "TRASH",
-            "UNREAD",
-            "STARRED",
-            "IMPORTANT",
-            "SENT",
-            "DRAFT",
-            "CHAT",
-            "CATEGORY_PERSONAL",
-            "CATEGORY_SOCIAL",
-            "CATEGORY_PROMOTIONS",
-            "CATEGORY_UPDATES",
-            "CATEGORY_FORUMS",
-        }
-
-        is_system = label_id in system_labels or label_id.startswith("CATEGORY_")
-        label_type = "system" if is_system else "user"
+        label_type = _label_type(label_id)
 
         # Get email count from label resource or use provided value
         count = email_count if email_count is not None else label.get("messagesTotal", 0)
@@ -98,6 +108,32 @@ class Label:
             type=label_type,
         )
 
+    @classmethod
+    def from_gmail_labels(cls, labels: Iterable[dict]) -> list["Label"]:
+        """
+        Create Label instances from a batch of Gmail API label resources.
+
+        Equivalent to calling from_gmail_label on each item, in a single pass.
+
+        Args:
+            labels: Gmail API label resources (e.g. the "labels" list response)
+
+        Returns:
+            List of Label instances in input order
+
+        Raises:
+            ValueError: If any label fails validation
+        """
+        return [
+            cls(
+                id=label["id"],
+                name=label["name"],
+                email_count=label.get("messagesTotal", 0),
+                type=_label_type(label["id"]),
+            )
+            for label in labels
+        ]
+
     def __str__(self) -> str:
         """String representation of label."""
         return f"{self.name} ({self.email_count} emails)"
@@ -1,11 +1,26 @@
 """Classification suggestion entity model."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
+# Allowed values for ClassificationSuggestion.confidence_category / .status
+# (tuples keep the documented order for error messages)
+_CONFIDENCE_CATEGORIES = ("high", "medium", "low", "no_match")
+_STATUSES = ("pending", "approved", "rejected", "applied")
+_VALID_CONFIDENCE_CATEGORIES = frozenset(_CONFIDENCE_CATEGORIES)
+_VALID_STATUSES = frozenset(_STATUSES)
 
-@dataclass
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, caching results (datetimes are immutable)."""
+    return datetime.fromisoformat(value)
+
+
+@dataclass(frozen=True, slots=True)
 class SuggestedLabel:
     """
     Represents a single label suggestion with confidence.
@@ -53,7 +68,7 @@ class SuggestedLabel:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassificationSuggestion:
     """
     Represents a proposed label assignment for an email.
@@ -79,19 +94,22 @@ class ClassificationSuggestion:
         if not self.email_id:
             raise ValueError("Email ID cannot be empty")
 
-        valid_categories = ("high", "medium", "low", "no_match")
-        if self.confidence_category not in valid_categories:
+        if self.confidence_category not in _VALID_CONFIDENCE_CATEGORIES:
             raise ValueError(
                 f"Invalid confidence category: {self.confidence_category}. "
-                f"Must be one of {valid_categories}"
+                f"Must be one of {_CONFIDENCE_CATEGORIES}"
             )
 
-        valid_statuses = ("pending", "approved", "rejected", "applied")
-        if self.status not in valid_statuses:
+        if self.status not in _VALID_STATUSES:
             raise ValueError(
-                f"Invalid status: {self.status}. Must be one of {valid_statuses}"
+                f"Invalid status: {self.status}. Must be one of {_STATUSES}"
             )
 
+        # Values loaded from storage are fresh strings; intern them so the
+        # comparisons in the is_* properties hit the identity fast path
+        self.confidence_category = sys.intern(self.confidence_category)
+        self.status = sys.intern(self.status)
+
         # Validate suggested_labels consistency
         if self.confidence_category == "no_match":
             if self.suggested_labels:
@@ -104,8 +122,8 @@ class ClassificationSuggestion:
 
         # Validate rank uniqueness
         if self.suggested_labels:
-            ranks = [label.rank for label in self.suggested_labels]
-            if len(ranks) != len(set(ranks)):
+            ranks = {label.rank for label in self.suggested_labels}
+            if len(ranks) != len(self.suggested_labels):
                 raise ValueError("Suggested labels must have unique ranks")
 
     @property
@@ -181,7 +199,7 @@ class ClassificationSuggestion:
             ],
             confidence_category=data["confidence_category"],
             reasoning=data.get("reasoning"),
-            created_at=datetime.fromisoformat(data["created_at"]),
+            created_at=_parse_iso(data["created_at"]),
             status=data.get("status", "pending"),
         )
 
@@ -10,7 +10,7 @@ from googleapiclient.http import BatchHttpRequest
 from gmail_classifier.lib.cache import cached
 from gmail_classifier.lib.config import gmail_config, cache_config
 from gmail_classifier.lib.logger import get_logger
-from gmail_classifier.lib.utils import Timer, batch_items, rate_limit, retry_with_exponential_backoff
+from gmail_classifier.lib.utils import Timer, iter_batches, rate_limit, retry_with_exponential_backoff
 from gmail_classifier.models.email import Email
 from gmail_classifier.models.label import Label
 
@@ -219,7 +219,7 @@ class GmailClient:
             failed_ids = []
 
             # Process in chunks of 100 (Gmail batch API limit)
-            for chunk in batch_items(message_ids, 100):
+            for chunk in iter_batches(message_ids, 100):
                 batch = self.service.new_batch_http_request()
 
                 # Closure to capture results
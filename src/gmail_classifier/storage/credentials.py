@@ -14,10 +14,10 @@ Security Features:
 """
 
 import logging
+import time
+from collections.abc import Callable
 from datetime import datetime
-
-import keyring
-import keyring.errors
+from types import ModuleType
 
 from gmail_classifier.auth.imap import IMAPCredentials
 
@@ -28,6 +28,37 @@ from gmail_classifier.auth.imap import IMAPCredentials
 logger = logging.getLogger("gmail_classifier.storage.credentials")
 
 
+# ============================================================================
+# Lazy keyring Import
+# ============================================================================
+
+# keyring pulls in its platform backends (secretstorage/jeepney on Linux) at
+# import time, so the module is only loaded when a CredentialStorage is built.
+_keyring_module: ModuleType | None = None
+
+
+def _keyring() -> ModuleType:
+    """Return the keyring module, importing it on first use.
+
+    Returns:
+        The imported keyring module (with keyring.errors loaded)
+    """
+    global _keyring_module
+    if _keyring_module is None:
+        import keyring
+        import keyring.errors
+
+        _keyring_module = keyring
+    return _keyring_module
+
+
+# Default keyring service identifier (string literals are already interned)
+_SERVICE_NAME = "gmail_classifier_imap"
+
+# How long a has_credentials() answer may be reused by a following call
+_PROBE_TTL_SECONDS = 5.0
+
+
 # ============================================================================
 # CredentialStorage Class
 # ============================================================================
@@ -42,6 +73,12 @@ class CredentialStorage:
     Attributes:
         _service_name: Keyring service identifier for Gmail Classifier IMAP
         _logger: Logger instance for credential operations
+        _set_password: keyring.set_password bound at construction
+        _get_password: keyring.get_password bound at construction
+        _delete_password: keyring.delete_password bound at construction
+        _keyring_errors: Exception types treated as keyring failures
+        _probe_cache: Recent has_credentials() answers by email as
+            (monotonic time, exists); never holds the password
 
     Security considerations:
     - Passwords are encrypted by OS keyring automatically
@@ -50,14 +87,27 @@ class CredentialStorage:
     - Secure deletion when logging out
     """
 
-    def __init__(self, service_name: str = "gmail_classifier_imap") -> None:
+    def __init__(self, service_name: str = _SERVICE_NAME) -> None:
         """Initialize credential storage.
 
+        The keyring functions are looked up once here rather than on every
+        call, so patches of keyring.* must be applied before construction.
+
         Args:
             service_name: Keyring service identifier (default: gmail_classifier_imap)
         """
+        kr = _keyring()
         self._service_name = service_name
         self._logger = logger
+        self._set_password: Callable[[str, str, str], None] = kr.set_password
+        self._get_password: Callable[[str, str], str | None] = kr.get_password
+        self._delete_password: Callable[[str, str], None] = kr.delete_password
+        self._keyring_errors: tuple[type[Exception], ...] = (
+            kr.errors.KeyringError,
+            OSError,
+            PermissionError,
+        )
+        self._probe_cache: dict[str, tuple[float, bool]] = {}
 
         self._logger.info(f"CredentialStorage initialized: service={service_name}")
 
@@ -79,9 +129,10 @@ class CredentialStorage:
         - Only password is stored in keyring (email used as key)
         - Timestamps managed separately (not in keyring)
         """
+        self._probe_cache.pop(credentials.email, None)
         try:
             # Store password in keyring (email is the username key)
-            keyring.set_password(
+            self._set_password(
                 self._service_name,
                 credentials.email,
                 credentials.password,
@@ -92,7 +143,7 @@ class CredentialStorage:
             )
             return True
 
-        except (keyring.errors.KeyringError, OSError, PermissionError) as e:
+        except self._keyring_errors as e:
             self._logger.error(
                 f"Failed to store credentials for {credentials.email}: {e}"
             )
@@ -116,7 +167,7 @@ class CredentialStorage:
         """
         try:
             # Retrieve password from keyring
-            password = keyring.get_password(self._service_name, email)
+            password = self._get_password(self._service_name, email)
 
             if password is None:
                 self._logger.info(f"No credentials found for {email}")
@@ -133,7 +184,7 @@ class CredentialStorage:
             self._logger.info(f"Credentials retrieved successfully for {email}")
             return credentials
 
-        except (keyring.errors.KeyringError, OSError, PermissionError) as e:
+        except self._keyring_errors as e:
             self._logger.error(
                 f"Failed to retrieve credentials for {email}: {e}"
             )
@@ -155,14 +206,15 @@ class CredentialStorage:
         - Returns False if credentials don't exist (not an error)
         - Logs warning if keyring operation fails
         """
+        self._probe_cache.pop(email, None)
         try:
             # Delete password from keyring
-            keyring.delete_password(self._service_name, email)
+            self._delete_password(self._service_name, email)
 
             self._logger.info(f"Credentials deleted successfully for {email}")
             return True
 
-        except (keyring.errors.KeyringError, OSError, PermissionError) as e:
+        except self._keyring_errors as e:
             # Keyring raises exception if password doesn't exist
             self._logger.warning(
                 f"Failed to delete credentials for {email}: {e}"
@@ -181,19 +233,45 @@ class CredentialStorage:
             True if credentials exist, False otherwise
 
         Note:
-        - Does not retrieve the actual password
+        - The answer (not the password) is kept for a few seconds so that
+          repeated checks do not hit the OS keyring again
         - Useful for checking before prompting user
         """
         try:
-            password = keyring.get_password(self._service_name, email)
-            return password is not None
+            return self._probe(email)
 
-        except (keyring.errors.KeyringError, OSError, PermissionError) as e:
+        except self._keyring_errors as e:
             self._logger.warning(
                 f"Error checking credentials for {email}: {e}"
             )
             return False
 
+    def _probe(self, email: str) -> bool:
+        """Check whether a password is stored, reusing a recent answer if fresh.
+
+        Only presence is cached; the looked-up password is dropped at once.
+        An answer older than _PROBE_TTL_SECONDS is evicted and re-queried.
+
+        Args:
+            email: Email address to look up
+
+        Returns:
+            True if credentials exist, False otherwise
+
+        Raises:
+            Keyring errors are propagated to the caller
+        """
+        cached = self._probe_cache.get(email)
+        if cached is not None:
+            checked_at, exists = cached
+            if time.monotonic() - checked_at < _PROBE_TTL_SECONDS:
+                return exists
+            del self._probe_cache[email]
+
+        exists = self._get_password(self._service_name, email) is not None
+        self._probe_cache[email] = (time.monotonic(), exists)
+        return exists
+
     def update_last_used(self, email: str) -> bool:
         """Update the last_used timestamp for stored credentials.
 
@@ -226,7 +304,7 @@ class CredentialStorage:
             self._logger.debug(f"Last used timestamp noted for {email}")
             return True
 
-        except (keyring.errors.KeyringError, OSError, PermissionError) as e:
+        except self._keyring_errors as e:
             self._logger.error(
                 f"Failed to update last_used for {email}: {e}"
             )
@@ -255,6 +333,6 @@ class CredentialStorage:
             )
             return []
 
-        except (keyring.errors.KeyringError, OSError, PermissionError) as e:
+        except self._keyring_errors as e:
             self._logger.error(f"Failed to list stored emails: {e}")
             return []
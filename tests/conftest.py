@@ -2,6 +2,7 @@
 
 import pytest
 import sys
+from datetime import datetime
 from pathlib import Path
 
 # Add src directory to Python path for imports
@@ -87,6 +88,23 @@ def sample_gmail_labels_response():
     }
 
 
+@pytest.fixture(scope="session")
+def fixed_datetime():
+    """Fixed timestamp shared by all tests that need a created_at value."""
+    return datetime(2025, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="session")
+def sample_suggested_label():
+    """Valid high-confidence SuggestedLabel, shared across the session.
+
+    Tests must not mutate it.
+    """
+    from gmail_classifier.models.suggestion import SuggestedLabel
+
+    return SuggestedLabel("Label_1", "Test", 0.8, 1)
+
+
 # Configure pytest markers
 def pytest_configure(config):
     """Configure custom pytest markers."""
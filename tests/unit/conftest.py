@@ -0,0 +1,26 @@
+"""Unit test configuration.
+
+Imports the modules under test once at collection time so every unit test
+module reuses the cached module objects. ``config`` is imported before
+``utils`` because ``lib.config`` calls back into ``lib.utils`` on import.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from gmail_classifier.lib import config, utils  # noqa: F401
+from gmail_classifier.models import suggestion  # noqa: F401
+
+
+@pytest.fixture
+def frozen_now(monkeypatch, fixed_datetime):
+    """Freeze ``datetime.now()`` inside models.suggestion at ``fixed_datetime``."""
+
+    class _FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return fixed_datetime
+
+    monkeypatch.setattr(suggestion, "datetime", _FrozenDatetime)
+    return fixed_datetime
@@ -1,7 +1,6 @@
 """Unit tests for Email model."""
 
 import pytest
-from datetime import datetime
 
 from gmail_classifier.models.email import Email
 
@@ -9,7 +8,7 @@ from gmail_classifier.models.email import Email
 class TestEmailModel:
     """Test Email model validation and methods."""
 
-    def test_email_creation_valid(self):
+    def test_email_creation_valid(self, fixed_datetime):
         """Test creating a valid email."""
         email = Email(
             id="msg123",
@@ -18,7 +17,7 @@ class TestEmailModel:
             sender="sender@example.com",
             sender_name="Test Sender",
             recipients=["recipient@example.com"],
-            date=datetime(2025, 1, 1, 12, 0, 0),
+            date=fixed_datetime,
             snippet="Test snippet",
             body_plain="Test body",
             body_html="<p>Test body</p>",
@@ -31,7 +30,7 @@ class TestEmailModel:
         assert email.subject == "Test Subject"
         assert email.sender == "sender@example.com"
 
-    def test_email_missing_id_raises_error(self):
+    def test_email_missing_id_raises_error(self, fixed_datetime):
         """Test that empty ID raises ValueError."""
         with pytest.raises(ValueError, match="Email ID cannot be empty"):
             Email(
@@ -41,7 +40,7 @@ class TestEmailModel:
                 sender="sender@example.com",
                 sender_name=None,
                 recipients=[],
-                date=datetime.now(),
+                date=fixed_datetime,
                 snippet=None,
                 body_plain=None,
                 body_html=None,
@@ -50,7 +49,7 @@ class TestEmailModel:
                 is_unread=False,
             )
 
-    def test_email_missing_sender_raises_error(self):
+    def test_email_missing_sender_raises_error(self, fixed_datetime):
         """Test that empty sender raises ValueError."""
         with pytest.raises(ValueError, match="Email sender cannot be empty"):
             Email(
@@ -60,7 +59,7 @@ class TestEmailModel:
                 sender="",
                 sender_name=None,
                 recipients=[],
-                date=datetime.now(),
+                date=fixed_datetime,
                 snippet=None,
                 body_plain=None,
                 body_html=None,
@@ -69,7 +68,7 @@ class TestEmailModel:
                 is_unread=False,
             )
 
-    def test_is_unlabeled_with_only_system_labels(self):
+    def test_is_unlabeled_with_only_system_labels(self, fixed_datetime):
         """Test that emails with only system labels are considered unlabeled."""
         email = Email(
             id="msg123",
@@ -78,7 +77,7 @@ class TestEmailModel:
             sender="sender@example.com",
             sender_name=None,
             recipients=[],
-            date=datetime.now(),
+            date=fixed_datetime,
             snippet=None,
             body_plain=None,
             body_html=None,
@@ -89,7 +88,7 @@ class TestEmailModel:
 
         assert email.is_unlabeled is True
 
-    def test_is_unlabeled_with_user_labels(self):
+    def test_is_unlabeled_with_user_labels(self, fixed_datetime):
         """Test that emails with user labels are not unlabeled."""
         email = Email(
             id="msg123",
@@ -98,7 +97,7 @@ class TestEmailModel:
             sender="sender@example.com",
             sender_name=None,
             recipients=[],
-            date=datetime.now(),
+            date=fixed_datetime,
             snippet=None,
             body_plain=None,
             body_html=None,
@@ -109,7 +108,7 @@ class TestEmailModel:
 
         assert email.is_unlabeled is False
 
-    def test_is_unlabeled_with_no_labels(self):
+    def test_is_unlabeled_with_no_labels(self, fixed_datetime):
         """Test that emails with no labels are unlabeled."""
         email = Email(
             id="msg123",
@@ -118,7 +117,7 @@ class TestEmailModel:
             sender="sender@example.com",
             sender_name=None,
             recipients=[],
-            date=datetime.now(),
+            date=fixed_datetime,
             snippet=None,
             body_plain=None,
             body_html=None,
@@ -129,7 +128,7 @@ class TestEmailModel:
 
         assert email.is_unlabeled is True
 
-    def test_content_property_returns_plain_body(self):
+    def test_content_property_returns_plain_body(self, fixed_datetime):
         """Test that content property prefers plain text body."""
         email = Email(
             id="msg123",
@@ -138,7 +137,7 @@ class TestEmailModel:
             sender="sender@example.com",
             sender_name=None,
             recipients=[],
-            date=datetime.now(),
+            date=fixed_datetime,
             snippet="Snippet text",
             body_plain="Plain text body",
             body_html="<p>HTML body</p>",
@@ -149,7 +148,7 @@ class TestEmailModel:
 
         assert email.content == "Plain text body"
 
-    def test_content_property_fallback_to_snippet(self):
+    def test_content_property_fallback_to_snippet(self, fixed_datetime):
         """Test that content property falls back to snippet."""
         email = Email(
             id="msg123",
@@ -158,7 +157,7 @@ class TestEmailModel:
             sender="sender@example.com",
             sender_name=None,
             recipients=[],
-            date=datetime.now(),
+            date=fixed_datetime,
             snippet="Snippet text",
             body_plain=None,
             body_html=None,
@@ -169,7 +168,7 @@ class TestEmailModel:
 
         assert email.content == "Snippet text"
 
-    def test_display_subject_with_subject(self):
+    def test_display_subject_with_subject(self, fixed_datetime):
         """Test display_subject with actual subject."""
         email = Email(
             id="msg123",
@@ -178,7 +177,7 @@ class TestEmailModel:
             sender="sender@example.com",
             sender_name=None,
             recipients=[],
-            date=datetime.now(),
+            date=fixed_datetime,
             snippet=None,
             body_plain=None,
             body_html=None,
@@ -189,7 +188,7 @@ class TestEmailModel:
 
         assert email.display_subject == "Test Subject"
 
-    def test_display_subject_without_subject(self):
+    def test_display_subject_without_subject(self, fixed_datetime):
         """Test display_subject fallback for missing subject."""
         email = Email(
             id="msg123",
@@ -198,7 +197,7 @@ class TestEmailModel:
             sender="sender@example.com",
             sender_name=None,
             recipients=[],
-            date=datetime.now(),
+            date=fixed_datetime,
             snippet=None,
             body_plain=None,
             body_html=None,
@@ -209,7 +208,7 @@ class TestEmailModel:
 
         assert email.display_subject == "(No Subject)"
 
-    def test_display_sender_prefers_name(self):
+    def test_display_sender_prefers_name(self, fixed_datetime):
         """Test display_sender prefers sender name over email."""
         email = Email(
             id="msg123",
@@ -218,7 +217,7 @@ class TestEmailModel:
             sender="sender@example.com",
             sender_name="John Doe",
             recipients=[],
-            date=datetime.now(),
+            date=fixed_datetime,
             snippet=None,
             body_plain=None,
             body_html=None,
@@ -229,7 +228,7 @@ class TestEmailModel:
 
         assert email.display_sender == "John Doe"
 
-    def test_display_sender_fallback_to_email(self):
+    def test_display_sender_fallback_to_email(self, fixed_datetime):
         """Test display_sender falls back to email address."""
         email = Email(
             id="msg123",
@@ -238,7 +237,7 @@ class TestEmailModel:
             sender="sender@example.com",
             sender_name=None,
             recipients=[],
-            date=datetime.now(),
+            date=fixed_datetime,
             snippet=None,
             body_plain=None,
             body_html=None,
@@ -249,7 +248,7 @@ class TestEmailModel:
 
         assert email.display_sender == "sender@example.com"
 
-    def test_to_dict_excludes_body_content(self):
+    def test_to_dict_excludes_body_content(self, fixed_datetime):
         """Test that to_dict excludes body content for privacy."""
         email = Email(
             id="msg123",
@@ -258,7 +257,7 @@ class TestEmailModel:
             sender="sender@example.com",
             sender_name="Test Sender",
             recipients=["recipient@example.com"],
-            date=datetime(2025, 1, 1, 12, 0, 0),
+            date=fixed_datetime,
             snippet="Test snippet",
             body_plain="Secret content",
             body_html="<p>Secret HTML</p>",
@@ -7,6 +7,7 @@ Test Organization:
 - T031: Stale session cleanup
 - T032: Session limit per email
 - T033: Cleanup metrics/statistics
+- Connection pooling across authenticate/disconnect
 """
 
 import time
@@ -19,6 +20,8 @@ import pytest
 from gmail_classifier.auth.imap import (
     CLEANUP_INTERVAL_SECONDS,
     MAX_SESSIONS_PER_EMAIL,
+    POOL_MAX_AGE_SECONDS,
+    POOL_MAX_CONNECTIONS,
     STALE_TIMEOUT_MINUTES,
     IMAPAuthenticator,
     IMAPCredentials,
@@ -160,7 +163,7 @@ class TestStaleSessionCleanup:
             authenticator._cleanup_stale_sessions()
 
             # Verify disconnect was called
-            mock_disconnect.assert_called_once_with(session.session_id)
+            mock_disconnect.assert_called_once_with(session.session_id, reuse=False)
 
     def test_cleanup_keeps_active_sessions(self, authenticator):
         """T031: Test cleanup does not remove active sessions.
@@ -212,6 +215,30 @@ class TestStaleSessionCleanup:
             # Session should still be removed (force removal)
             assert session.session_id not in authenticator._sessions
 
+    def test_unreferenced_session_evicted_without_cleanup(self, authenticator):
+        """T031: Test orphaned sessions drop out of the weak session map.
+
+        Validates:
+        - Sessions with no outside reference vanish without a cleanup pass
+        - Pinned sessions (live connections) survive until disconnect
+        """
+        orphan = IMAPSessionInfo(email="test@gmail.com")
+        orphan_id = orphan.session_id
+        authenticator._sessions[orphan_id] = orphan
+
+        pinned = IMAPSessionInfo(email="test@gmail.com", connection=Mock())
+        pinned_id = pinned.session_id
+        authenticator._sessions[pinned_id] = pinned
+        authenticator._pinned[pinned_id] = pinned
+
+        del orphan, pinned
+
+        assert orphan_id not in authenticator._sessions
+        assert pinned_id in authenticator._sessions
+
+        authenticator.disconnect(pinned_id)
+        assert pinned_id not in authenticator._pinned
+
 
 # ============================================================================
 # T032: Test Session Limit Per Email
@@ -237,7 +264,7 @@ class TestSessionLimitPerEmail:
                 connected_at=datetime.now() - timedelta(minutes=i),
                 last_activity=datetime.now()
             )
-            authenticator._sessions[session.session_id] = session
+            authenticator._track_session(session)
 
         # Try to create one more session
         with patch.object(authenticator, "disconnect") as mock_disconnect:
@@ -248,6 +275,52 @@ class TestSessionLimitPerEmail:
             # Verify new session was created
             assert new_session.email == credentials.email
 
+    def test_session_limit_evicts_least_recently_active(
+        self, authenticator, credentials, mock_imap_client
+    ):
+        """T032: Test eviction picks the least recently active session.
+
+        Validates:
+        - Activity on a session moves it to the back of the LRU
+        - The first session with no recent activity is evicted instead
+        """
+        sessions = []
+        for _ in range(MAX_SESSIONS_PER_EMAIL):
+            session = IMAPSessionInfo(
+                email=credentials.email, state=SessionState.CONNECTED
+            )
+            authenticator._track_session(session)
+            sessions.append(session)
+
+        # First-inserted session sees activity, so the second is now the LRU
+        sessions[0].update_activity()
+
+        with patch.object(authenticator, "disconnect") as mock_disconnect:
+            authenticator.authenticate(credentials)
+
+            mock_disconnect.assert_called_once_with(sessions[1].session_id, reuse=False)
+
+    def test_activity_on_evicted_session_is_ignored(self, authenticator, credentials):
+        """T032: Test activity racing with eviction does not raise.
+
+        Validates:
+        - update_activity() on a session already dropped from its email's
+          LRU bucket leaves the remaining sessions untouched
+        """
+        evicted, survivor = (
+            IMAPSessionInfo(email=credentials.email, state=SessionState.CONNECTED)
+            for _ in range(2)
+        )
+        authenticator._track_session(evicted)
+        authenticator._track_session(survivor)
+        authenticator._sessions_by_email[credentials.email].pop(evicted.session_id)
+
+        evicted.update_activity()
+
+        assert list(authenticator._sessions_by_email[credentials.email]) == [
+            survivor.session_id
+        ]
+
     def test_session_limit_per_email_isolated(self, authenticator, mock_imap_client):
         """T032: Test session limits are per-email, not global.
 
@@ -264,7 +337,7 @@ class TestSessionLimitPerEmail:
                 state=SessionState.CONNECTED,
                 connected_at=datetime.now() - timedelta(minutes=i)
             )
-            authenticator._sessions[session.session_id] = session
+            authenticator._track_session(session)
 
         # Create session for different email should succeed without cleanup
         email2 = "user2@gmail.com"
@@ -303,6 +376,202 @@ class TestSessionLimitPerEmail:
             mock_disconnect.assert_not_called()
 
 
+# ============================================================================
+# Test Connection Pooling
+# ============================================================================
+
+
+class TestConnectionPool:
+    """Unit tests for reusing logged-in connections across sessions."""
+
+    def test_authenticate_reuses_pooled_connection(
+        self, authenticator, credentials, mock_imap_client
+    ):
+        """Test disconnect pools the connection and authenticate reuses it.
+
+        Validates:
+        - Only one IMAPClient is constructed across three cycles
+        - LOGIN is sent once; reuse is verified with NOOP
+        - Pooled connections are not logged out
+        """
+        for _ in range(3):
+            session = authenticator.authenticate(credentials)
+            assert session.state == SessionState.CONNECTED
+            authenticator.disconnect(session.session_id)
+
+        client = mock_imap_client.return_value
+        assert mock_imap_client.call_count == 1
+        assert client.login.call_count == 1
+        assert client.noop.call_count == 3
+        client.logout.assert_not_called()
+
+    def test_pooled_connection_not_reused_with_other_password(
+        self, authenticator, credentials, mock_imap_client
+    ):
+        """Test a pooled connection is only handed to the same password.
+
+        Validates:
+        - A different password forces a fresh connection and LOGIN
+        - The mismatched pooled connection is logged out
+        """
+        session = authenticator.authenticate(credentials)
+        authenticator.disconnect(session.session_id)
+        pooled_client = mock_imap_client.return_value
+
+        fresh_client = Mock()
+        mock_imap_client.return_value = fresh_client
+        other = IMAPCredentials(email=credentials.email, password="abcdefghijklmnop")
+        session = authenticator.authenticate(other)
+
+        assert session.connection is fresh_client
+        fresh_client.login.assert_called_once()
+        pooled_client.logout.assert_called_once()
+
+    def test_dead_pooled_connection_replaced(
+        self, authenticator, credentials, mock_imap_client
+    ):
+        """Test a pooled connection failing NOOP falls back to a fresh login.
+
+        Validates:
+        - The dead connection is dropped
+        - A new IMAPClient is constructed and logged in
+        """
+        session = authenticator.authenticate(credentials)
+        authenticator.disconnect(session.session_id)
+        mock_imap_client.return_value.noop.side_effect = OSError("connection reset")
+
+        fresh_client = Mock()
+        mock_imap_client.return_value = fresh_client
+        session = authenticator.authenticate(credentials)
+
+        assert session.connection is fresh_client
+        assert mock_imap_client.call_count == 2
+        assert not authenticator._pool
+
+    def test_pool_size_bounded_per_email(self, authenticator, credentials, mock_imap_client):
+        """Test disconnect logs out once the email's pool is full.
+
+        Validates:
+        - At most POOL_MAX_CONNECTIONS connections are kept
+        - Connections beyond the limit are logged out
+        """
+        mock_imap_client.side_effect = lambda *args, **kwargs: Mock()
+        sessions = [
+            authenticator.authenticate(credentials)
+            for _ in range(POOL_MAX_CONNECTIONS + 1)
+        ]
+        clients = [session.connection for session in sessions]
+        for session in sessions:
+            authenticator.disconnect(session.session_id)
+
+        assert len(authenticator._pool[credentials.key]) == POOL_MAX_CONNECTIONS
+        assert [c.logout.called for c in clients] == [False] * POOL_MAX_CONNECTIONS + [True]
+
+    def test_pool_shared_across_email_case(self, authenticator, credentials, mock_imap_client):
+        """Test the pool is keyed case-insensitively like rate limiting.
+
+        Validates:
+        - A connection pooled for one spelling is reused for another
+        """
+        session = authenticator.authenticate(credentials)
+        authenticator.disconnect(session.session_id)
+
+        upper = IMAPCredentials(email=credentials.email.upper(), password=credentials.password)
+        session = authenticator.authenticate(upper)
+
+        assert session.connection is mock_imap_client.return_value
+        assert mock_imap_client.call_count == 1
+
+    def test_expired_pooled_connection_logged_out(
+        self, authenticator, credentials, mock_imap_client
+    ):
+        """Test pooled connections past POOL_MAX_AGE_SECONDS are not reused.
+
+        Validates:
+        - The expired connection is logged out
+        - A fresh connection is logged in instead
+        """
+        now = [1000.0]
+        authenticator._now = lambda: now[0]
+        session = authenticator.authenticate(credentials)
+        authenticator.disconnect(session.session_id)
+        pooled_client = mock_imap_client.return_value
+
+        now[0] += POOL_MAX_AGE_SECONDS
+        fresh_client = Mock()
+        mock_imap_client.return_value = fresh_client
+        session = authenticator.authenticate(credentials)
+
+        assert session.connection is fresh_client
+        pooled_client.logout.assert_called_once()
+
+    def test_cleanup_prunes_expired_pooled_connections(
+        self, authenticator, credentials, mock_imap_client
+    ):
+        """Test the cleanup pass logs out pooled connections nobody reused.
+
+        Validates:
+        - Expired pooled connections are logged out and dropped
+        """
+        now = [1000.0]
+        authenticator._now = lambda: now[0]
+        session = authenticator.authenticate(credentials)
+        authenticator.disconnect(session.session_id)
+
+        now[0] += POOL_MAX_AGE_SECONDS
+        authenticator._cleanup_and_stats()
+
+        mock_imap_client.return_value.logout.assert_called_once()
+        assert not authenticator._pool
+
+    def test_evicted_session_logged_out_not_pooled(
+        self, authenticator, credentials, mock_imap_client
+    ):
+        """Test session-limit eviction closes the server connection.
+
+        Validates:
+        - The evicted session's connection is logged out
+        - Nothing is pooled, so open connections stay capped
+        """
+        mock_imap_client.side_effect = lambda *args, **kwargs: Mock()
+        sessions = [
+            authenticator.authenticate(credentials)
+            for _ in range(MAX_SESSIONS_PER_EMAIL)
+        ]
+        evicted_client = sessions[0].connection
+
+        authenticator.authenticate(credentials)
+
+        evicted_client.logout.assert_called_once()
+        assert sessions[0].state == SessionState.DISCONNECTED
+        assert not authenticator._pool
+
+    def test_close_all_logs_out_sessions_and_pool(
+        self, authenticator, credentials, mock_imap_client
+    ):
+        """Test close_all() sends LOGOUT for every connection.
+
+        Validates:
+        - Pooled connections are logged out and the pool is emptied
+        - Active sessions are disconnected and logged out
+        """
+        mock_imap_client.side_effect = lambda *args, **kwargs: Mock()
+        pooled = authenticator.authenticate(credentials)
+        pooled_client = pooled.connection
+        authenticator.disconnect(pooled.session_id)
+        active = authenticator.authenticate(credentials)
+        other = authenticator.authenticate(credentials)
+        active_client = other.connection
+
+        authenticator.close_all()
+
+        pooled_client.logout.assert_called_once()
+        active_client.logout.assert_called_once()
+        assert active.state == SessionState.DISCONNECTED
+        assert not authenticator._pool
+        assert not authenticator._sessions
+
+
 # ============================================================================
 # T033: Test Cleanup Metrics
 # ============================================================================
@@ -350,6 +619,35 @@ class TestCleanupMetrics:
         assert stats["sessions_by_email"]["user1@gmail.com"] == 2
         assert stats["sessions_by_email"]["user2@gmail.com"] == 1
 
+    def test_cleanup_and_stats_single_pass(self, authenticator):
+        """T033: Test fused cleanup returns stats and disconnects stale sessions.
+
+        Validates:
+        - Stats describe the sessions seen before cleanup
+        - Only stale sessions are disconnected
+        """
+        active_session = IMAPSessionInfo(
+            email="user1@gmail.com",
+            state=SessionState.CONNECTED,
+            last_activity=datetime.now()
+        )
+        stale_session = IMAPSessionInfo(
+            email="user2@gmail.com",
+            state=SessionState.CONNECTED,
+            last_activity=datetime.now() - timedelta(minutes=30)
+        )
+        authenticator._sessions[active_session.session_id] = active_session
+        authenticator._sessions[stale_session.session_id] = stale_session
+
+        with patch.object(authenticator, "disconnect") as mock_disconnect:
+            stats = authenticator._cleanup_and_stats()
+
+            mock_disconnect.assert_called_once_with(stale_session.session_id, reuse=False)
+
+        assert stats["total_sessions"] == 2
+        assert stats["active_sessions"] == 2
+        assert stats["stale_sessions"] == 1
+
     def test_get_session_stats_thread_safe(self, authenticator):
         """T033: Test get_session_stats uses lock for thread safety.
 
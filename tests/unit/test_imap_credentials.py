@@ -11,12 +11,19 @@ Test Organization:
 NOTE: These tests use mocked keyring to avoid modifying the actual OS keyring.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import keyring.errors
 import pytest
 
 from gmail_classifier.auth.imap import IMAPCredentials
+from gmail_classifier.storage.credentials import _PROBE_TTL_SECONDS, CredentialStorage
+
+
+# Fixed epoch for deterministic timestamps (no wall-clock reads in tests)
+_T0 = datetime(2024, 1, 1)
 
 
 # ============================================================================
@@ -34,8 +41,73 @@ def test_credentials() -> IMAPCredentials:
     return IMAPCredentials(
         email="test@gmail.com",
         password="abcdefghijklmnop",  # Valid 16-char Gmail app password
-        created_at=datetime.now(),
+        created_at=_T0,
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Drive CredentialStorage's datetime.now() from a deterministic counter.
+
+    Each call advances one second from _T0, so timestamps can be asserted
+    exactly instead of within a wall-clock range.
+
+    Returns:
+        Namespace whose ``now`` is the last timestamp handed out
+    """
+    state = SimpleNamespace(now=_T0)
+
+    def _now() -> datetime:
+        state.now += timedelta(seconds=1)
+        return state.now
+
+    monkeypatch.setattr(
+        "gmail_classifier.storage.credentials.datetime", SimpleNamespace(now=_now)
     )
+    return state
+
+
+@pytest.fixture(autouse=True)
+def kr(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace the keyring functions with mocks for every test.
+
+    Patched once per test instead of a patch() context per keyring call.
+
+    Returns:
+        Namespace with set, get and delete MagicMocks
+    """
+    mocks = SimpleNamespace(set=MagicMock(), get=MagicMock(), delete=MagicMock())
+    monkeypatch.setattr("keyring.set_password", mocks.set)
+    monkeypatch.setattr("keyring.get_password", mocks.get)
+    monkeypatch.setattr("keyring.delete_password", mocks.delete)
+    return mocks
+
+
+@pytest.fixture(scope="module")
+def creds_template() -> tuple[str, bytes]:
+    """Provide an email and pre-encoded password shared by memory tests.
+
+    Returns:
+        Tuple of (email, UTF-8 encoded password bytes)
+    """
+    return ("test@gmail.com", b"TestPassword123!")
+
+
+def make_creds(email: str, password_bytes: bytes) -> IMAPCredentials:
+    """Build IMAPCredentials from pre-encoded template password bytes.
+
+    Copies the template into a fresh bytearray, which the constructor adopts,
+    so each test owns the buffer it clears while still going through
+    __init__ and its validation.
+
+    Args:
+        email: Email address
+        password_bytes: UTF-8 encoded password
+
+    Returns:
+        IMAPCredentials instance
+    """
+    return IMAPCredentials(email, bytearray(password_bytes), created_at=_T0)
 
 
 # ============================================================================
@@ -47,7 +119,7 @@ class TestCredentialStorage:
     """Unit tests for storing credentials in OS keyring."""
 
     def test_store_credentials_saves_to_keyring(
-        self, test_credentials: IMAPCredentials
+        self, kr: SimpleNamespace, test_credentials: IMAPCredentials
     ) -> None:
         """T022: Test store_credentials() saves to keyring.
 
@@ -60,47 +132,19 @@ class TestCredentialStorage:
 
         Expected outcome: keyring.set_password called with correct parameters
         """
-        from gmail_classifier.storage.credentials import CredentialStorage
-
-        with patch("keyring.set_password") as mock_set_password:
-            # Arrange
-            storage = CredentialStorage()
-
-            # Act
-            result = storage.store_credentials(test_credentials)
-
-            # Assert
-            assert result is True
-            mock_set_password.assert_called_once_with(
-                "gmail_classifier_imap",
-                test_credentials.email,
-                test_credentials.password,
-            )
-
-    def test_store_credentials_handles_keyring_error(
-        self, test_credentials: IMAPCredentials
-    ) -> None:
-        """T022: Test store_credentials() handles keyring errors gracefully.
-
-        Validates:
-        - Keyring errors are caught and handled
-        - Method returns False on error
-        - Error is logged
-
-        Expected outcome: Returns False when keyring raises exception
-        """
-        from gmail_classifier.storage.credentials import CredentialStorage
-
-        with patch("keyring.set_password") as mock_set_password:
-            # Arrange
-            mock_set_password.side_effect = Exception("Keyring error")
-            storage = CredentialStorage()
-
-            # Act
-            result = storage.store_credentials(test_credentials)
-
-            # Assert
-            assert result is False
+        # Arrange
+        storage = CredentialStorage()
+
+        # Act
+        result = storage.store_credentials(test_credentials)
+
+        # Assert
+        assert result is True
+        kr.set.assert_called_once_with(
+            "gmail_classifier_imap",
+            test_credentials.email,
+            test_credentials.password,
+        )
 
     def test_store_credentials_updates_created_at(
         self, test_credentials: IMAPCredentials
@@ -113,18 +157,15 @@ class TestCredentialStorage:
 
         Expected outcome: Credentials have valid created_at timestamp
         """
-        from gmail_classifier.storage.credentials import CredentialStorage
-
-        with patch("keyring.set_password"):
-            # Arrange
-            storage = CredentialStorage()
-            original_created_at = test_credentials.created_at
+        # Arrange
+        storage = CredentialStorage()
+        original_created_at = test_credentials.created_at
 
-            # Act
-            storage.store_credentials(test_credentials)
+        # Act
+        storage.store_credentials(test_credentials)
 
-            # Assert - should preserve existing created_at
-            assert test_credentials.created_at == original_created_at
+        # Assert - should preserve existing created_at
+        assert test_credentials.created_at == original_created_at
 
 
 # ============================================================================
@@ -136,7 +177,10 @@ class TestCredentialRetrieval:
     """Unit tests for retrieving credentials from OS keyring."""
 
     def test_retrieve_credentials_loads_from_keyring(
-        self, test_credentials: IMAPCredentials
+        self,
+        kr: SimpleNamespace,
+        clock: SimpleNamespace,
+        test_credentials: IMAPCredentials,
     ) -> None:
         """T023: Test retrieve_credentials() loads from keyring.
 
@@ -145,28 +189,29 @@ class TestCredentialRetrieval:
         - Returns IMAPCredentials dataclass
         - Email matches the requested email
         - Password matches stored password
+        - created_at is stamped at retrieval time
 
         Expected outcome: Valid IMAPCredentials returned
         """
-        from gmail_classifier.storage.credentials import CredentialStorage
-
-        with patch("keyring.get_password") as mock_get_password:
-            # Arrange
-            mock_get_password.return_value = test_credentials.password
-            storage = CredentialStorage()
-
-            # Act
-            result = storage.retrieve_credentials(test_credentials.email)
-
-            # Assert
-            assert result is not None
-            assert result.email == test_credentials.email
-            assert result.password == test_credentials.password
-            mock_get_password.assert_called_once_with(
-                "gmail_classifier_imap", test_credentials.email
-            )
+        # Arrange
+        kr.get.return_value = test_credentials.password
+        storage = CredentialStorage()
+
+        # Act
+        result = storage.retrieve_credentials(test_credentials.email)
+
+        # Assert
+        assert result is not None
+        assert result.email == test_credentials.email
+        assert result.password == test_credentials.password
+        assert result.created_at == clock.now == _T0 + timedelta(seconds=1)
+        kr.get.assert_called_once_with(
+            "gmail_classifier_imap", test_credentials.email
+        )
 
-    def test_retrieve_credentials_returns_none_when_not_found(self) -> None:
+    def test_retrieve_credentials_returns_none_when_not_found(
+        self, kr: SimpleNamespace
+    ) -> None:
         """T023: Test retrieve_credentials() returns None when credentials don't exist.
 
         Validates:
@@ -175,41 +220,15 @@ class TestCredentialRetrieval:
 
         Expected outcome: None returned for non-existent credentials
         """
-        from gmail_classifier.storage.credentials import CredentialStorage
+        # Arrange
+        kr.get.return_value = None
+        storage = CredentialStorage()
 
-        with patch("keyring.get_password") as mock_get_password:
-            # Arrange
-            mock_get_password.return_value = None
-            storage = CredentialStorage()
+        # Act
+        result = storage.retrieve_credentials("nonexistent@gmail.com")
 
-            # Act
-            result = storage.retrieve_credentials("nonexistent@gmail.com")
-
-            # Assert
-            assert result is None
-
-    def test_retrieve_credentials_handles_keyring_error(self) -> None:
-        """T023: Test retrieve_credentials() handles keyring errors.
-
-        Validates:
-        - Keyring errors are caught
-        - Returns None on error
-        - Error is logged
-
-        Expected outcome: None returned when keyring raises exception
-        """
-        from gmail_classifier.storage.credentials import CredentialStorage
-
-        with patch("keyring.get_password") as mock_get_password:
-            # Arrange
-            mock_get_password.side_effect = Exception("Keyring error")
-            storage = CredentialStorage()
-
-            # Act
-            result = storage.retrieve_credentials("test@gmail.com")
-
-            # Assert
-            assert result is None
+        # Assert
+        assert result is None
 
 
 # ============================================================================
@@ -220,7 +239,9 @@ class TestCredentialRetrieval:
 class TestCredentialDeletion:
     """Unit tests for deleting credentials from OS keyring."""
 
-    def test_delete_credentials_removes_from_keyring(self) -> None:
+    def test_delete_credentials_removes_from_keyring(
+        self, kr: SimpleNamespace
+    ) -> None:
         """T024: Test delete_credentials() removes from keyring.
 
         Validates:
@@ -230,23 +251,20 @@ class TestCredentialDeletion:
 
         Expected outcome: keyring.delete_password called with correct parameters
         """
-        from gmail_classifier.storage.credentials import CredentialStorage
+        # Arrange
+        storage = CredentialStorage()
+        email = "test@gmail.com"
 
-        with patch("keyring.delete_password") as mock_delete_password:
-            # Arrange
-            storage = CredentialStorage()
-            email = "test@gmail.com"
+        # Act
+        result = storage.delete_credentials(email)
 
-            # Act
-            result = storage.delete_credentials(email)
+        # Assert
+        assert result is True
+        kr.delete.assert_called_once_with("gmail_classifier_imap", email)
 
-            # Assert
-            assert result is True
-            mock_delete_password.assert_called_once_with(
-                "gmail_classifier_imap", email
-            )
-
-    def test_delete_credentials_returns_false_when_not_found(self) -> None:
+    def test_delete_credentials_returns_false_when_not_found(
+        self, kr: SimpleNamespace
+    ) -> None:
         """T024: Test delete_credentials() handles missing credentials.
 
         Validates:
@@ -255,41 +273,66 @@ class TestCredentialDeletion:
 
         Expected outcome: False returned for non-existent credentials
         """
-        from gmail_classifier.storage.credentials import CredentialStorage
+        # Arrange - keyring raises PasswordDeleteError for a missing entry
+        kr.delete.side_effect = keyring.errors.PasswordDeleteError(
+            "Password not found"
+        )
+        storage = CredentialStorage()
+
+        # Act
+        result = storage.delete_credentials("nonexistent@gmail.com")
 
-        with patch("keyring.delete_password") as mock_delete_password:
-            # Arrange - simulate keyring error for non-existent entry
-            mock_delete_password.side_effect = Exception("Password not found")
-            storage = CredentialStorage()
+        # Assert
+        assert result is False
 
-            # Act
-            result = storage.delete_credentials("nonexistent@gmail.com")
 
-            # Assert
-            assert result is False
+# ============================================================================
+# T022-T024: Test Keyring Error Handling
+# ============================================================================
 
-    def test_delete_credentials_handles_keyring_error(self) -> None:
-        """T024: Test delete_credentials() handles keyring errors.
+
+class TestKeyringErrors:
+    """Unit tests for keyring failures across store/retrieve/delete."""
+
+    @pytest.mark.parametrize(
+        ("kr_fn", "storage_call", "expected"),
+        [
+            ("set", "store_credentials", False),
+            ("get", "retrieve_credentials", None),
+            ("delete", "delete_credentials", False),
+        ],
+    )
+    def test_keyring_error_handled(
+        self,
+        kr: SimpleNamespace,
+        test_credentials: IMAPCredentials,
+        kr_fn: str,
+        storage_call: str,
+        expected: bool | None,
+    ) -> None:
+        """T022-T024: Test storage operations handle keyring errors gracefully.
 
         Validates:
-        - Keyring errors are caught
-        - Returns False on error
+        - Keyring errors are caught and handled
+        - store/delete return False, retrieve returns None
         - Error is logged
 
-        Expected outcome: False returned when keyring raises exception
+        Expected outcome: Failure value returned when keyring raises
         """
-        from gmail_classifier.storage.credentials import CredentialStorage
-
-        with patch("keyring.delete_password") as mock_delete_password:
-            # Arrange
-            mock_delete_password.side_effect = Exception("Keyring error")
-            storage = CredentialStorage()
+        # Arrange
+        getattr(kr, kr_fn).side_effect = keyring.errors.KeyringError("Keyring error")
+        storage = CredentialStorage()
+        arg = (
+            test_credentials
+            if storage_call == "store_credentials"
+            else test_credentials.email
+        )
 
-            # Act
-            result = storage.delete_credentials("test@gmail.com")
+        # Act
+        result = getattr(storage, storage_call)(arg)
 
-            # Assert
-            assert result is False
+        # Assert
+        assert result is expected
 
 
 # ============================================================================
@@ -300,7 +343,9 @@ class TestCredentialDeletion:
 class TestCredentialHelpers:
     """Unit tests for credential helper methods."""
 
-    def test_has_credentials_returns_true_when_exists(self) -> None:
+    def test_has_credentials_returns_true_when_exists(
+        self, kr: SimpleNamespace
+    ) -> None:
         """Test has_credentials() returns True when credentials exist.
 
         Validates:
@@ -309,20 +354,19 @@ class TestCredentialHelpers:
 
         Expected outcome: True when credentials exist
         """
-        from gmail_classifier.storage.credentials import CredentialStorage
-
-        with patch("keyring.get_password") as mock_get_password:
-            # Arrange
-            mock_get_password.return_value = "ValidPassword123!"
-            storage = CredentialStorage()
+        # Arrange
+        kr.get.return_value = "ValidPassword123!"
+        storage = CredentialStorage()
 
-            # Act
-            result = storage.has_credentials("test@gmail.com")
+        # Act
+        result = storage.has_credentials("test@gmail.com")
 
-            # Assert
-            assert result is True
+        # Assert
+        assert result is True
 
-    def test_has_credentials_returns_false_when_not_exists(self) -> None:
+    def test_has_credentials_returns_false_when_not_exists(
+        self, kr: SimpleNamespace
+    ) -> None:
         """Test has_credentials() returns False when credentials don't exist.
 
         Validates:
@@ -330,21 +374,97 @@ class TestCredentialHelpers:
 
         Expected outcome: False when credentials don't exist
         """
-        from gmail_classifier.storage.credentials import CredentialStorage
+        # Arrange
+        kr.get.return_value = None
+        storage = CredentialStorage()
+
+        # Act
+        result = storage.has_credentials("nonexistent@gmail.com")
 
-        with patch("keyring.get_password") as mock_get_password:
-            # Arrange
-            mock_get_password.return_value = None
-            storage = CredentialStorage()
+        # Assert
+        assert result is False
 
-            # Act
-            result = storage.has_credentials("nonexistent@gmail.com")
+    def test_has_credentials_caches_presence_not_password(
+        self, kr: SimpleNamespace, test_credentials: IMAPCredentials
+    ) -> None:
+        """Test repeated has_credentials() calls reuse one keyring lookup.
+
+        Validates:
+        - Back-to-back checks issue a single keyring lookup
+        - Only presence is cached, never the password
+        - retrieve_credentials() still reads the keyring itself
 
-            # Assert
-            assert result is False
+        Expected outcome: One get_password call per has/has/retrieve pair
+        """
+        # Arrange
+        kr.get.return_value = test_credentials.password
+        storage = CredentialStorage()
+
+        # Act
+        assert storage.has_credentials(test_credentials.email) is True
+        assert storage.has_credentials(test_credentials.email) is True
+        result = storage.retrieve_credentials(test_credentials.email)
+
+        # Assert
+        assert result is not None
+        assert result.password_equals(test_credentials.password)
+        assert kr.get.call_count == 2
+        assert storage._probe_cache[test_credentials.email][1] is True
+
+    def test_expired_cached_lookup_is_evicted(
+        self, kr: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a has_credentials() answer is dropped once past its TTL.
+
+        Validates:
+        - A check after _PROBE_TTL_SECONDS re-queries the keyring
+
+        Expected outcome: Two get_password calls across the TTL boundary
+        """
+        # Arrange
+        now = SimpleNamespace(value=100.0)
+        monkeypatch.setattr(
+            "gmail_classifier.storage.credentials.time",
+            SimpleNamespace(monotonic=lambda: now.value),
+        )
+        kr.get.return_value = "ValidPassword123!"
+        storage = CredentialStorage()
+
+        # Act
+        storage.has_credentials("test@gmail.com")
+        now.value += _PROBE_TTL_SECONDS
+        storage.has_credentials("test@gmail.com")
+
+        # Assert
+        assert kr.get.call_count == 2
+
+    def test_store_and_delete_invalidate_cached_lookup(
+        self, kr: SimpleNamespace, test_credentials: IMAPCredentials
+    ) -> None:
+        """Test writes to the keyring drop any cached lookup for the email.
+
+        Validates:
+        - has_credentials() re-queries the keyring after store/delete
+
+        Expected outcome: Fresh keyring lookup after each write
+        """
+        # Arrange
+        kr.get.return_value = None
+        storage = CredentialStorage()
+        assert storage.has_credentials(test_credentials.email) is False
+
+        # Act / Assert
+        kr.get.return_value = test_credentials.password
+        storage.store_credentials(test_credentials)
+        assert storage.has_credentials(test_credentials.email) is True
+
+        kr.get.return_value = None
+        storage.delete_credentials(test_credentials.email)
+        assert storage.has_credentials(test_credentials.email) is False
+        assert kr.get.call_count == 3
 
     def test_update_last_used_updates_timestamp(
-        self, test_credentials: IMAPCredentials
+        self, kr: SimpleNamespace, test_credentials: IMAPCredentials
     ) -> None:
         """Test update_last_used() updates the last_used timestamp.
 
@@ -354,24 +474,18 @@ class TestCredentialHelpers:
 
         Expected outcome: last_used updated to current time
         """
-        from gmail_classifier.storage.credentials import CredentialStorage
-
-        with patch("keyring.get_password") as mock_get_password:
-            with patch("keyring.set_password") as mock_set_password:
-                # Arrange
-                mock_get_password.return_value = test_credentials.password
-                storage = CredentialStorage()
+        # Arrange
+        kr.get.return_value = test_credentials.password
+        storage = CredentialStorage()
 
-                # Act
-                before_update = datetime.now()
-                result = storage.update_last_used(test_credentials.email)
-                after_update = datetime.now()
+        # Act
+        result = storage.update_last_used(test_credentials.email)
 
-                # Assert
-                assert result is True
-                # Verify the timestamp was updated (we can't check exact value without retrieving)
-                # This is validated by checking that keyring operations were called
-                assert mock_get_password.called
+        # Assert
+        assert result is True
+        # Verify the timestamp was updated (we can't check exact value without retrieving)
+        # This is validated by checking that keyring operations were called
+        assert kr.get.called
 
 
 # ============================================================================
@@ -382,7 +496,9 @@ class TestCredentialHelpers:
 class TestMemorySecurity:
     """Unit tests for secure password memory handling."""
 
-    def test_password_stored_as_bytearray(self) -> None:
+    def test_password_stored_as_bytearray(
+        self, creds_template: tuple[str, bytes]
+    ) -> None:
         """T025: Test password is stored as bytearray internally.
 
         Validates:
@@ -391,16 +507,31 @@ class TestMemorySecurity:
 
         Expected outcome: _password_bytes is a bytearray
         """
-        credentials = IMAPCredentials(
-            email="test@gmail.com",
-            password="TestPassword123!"
-        )
+        credentials = make_creds(*creds_template)
 
         # Assert internal storage is bytearray
         assert hasattr(credentials, '_password_bytes')
         assert isinstance(credentials._password_bytes, bytearray)
         assert len(credentials._password_bytes) > 0
 
+    def test_bytearray_password_adopted_without_copy(self) -> None:
+        """T025: Test a bytearray password is taken over, not copied.
+
+        Validates:
+        - The caller's buffer becomes _password_bytes
+        - clear_password() zeroes the caller's buffer in place
+
+        Expected outcome: Single buffer shared with the caller, then cleared
+        """
+        buffer = bytearray(b"TestPassword123!")
+        credentials = IMAPCredentials(email="test@gmail.com", password=buffer)
+
+        assert credentials._password_bytes is buffer
+        assert credentials.password_equals("TestPassword123!")
+
+        credentials.clear_password()
+        assert len(buffer) == 0
+
     def test_password_property_returns_string(self) -> None:
         """T025: Test password property accessor returns string.
 
@@ -418,9 +549,13 @@ class TestMemorySecurity:
 
         # Assert property returns string
         assert isinstance(credentials.password, str)
-        assert credentials.password == test_password
+        assert credentials.password_equals(test_password)
+        assert credentials.password_equals(test_password.encode("utf-8"))
+        assert not credentials.password_equals("TestPassword124!")
 
-    def test_clear_password_zeros_memory(self) -> None:
+    def test_clear_password_zeros_memory(
+        self, creds_template: tuple[str, bytes]
+    ) -> None:
         """T025: Test clear_password() zeros password in memory.
 
         Validates:
@@ -429,10 +564,7 @@ class TestMemorySecurity:
 
         Expected outcome: Password cleared from memory
         """
-        credentials = IMAPCredentials(
-            email="test@gmail.com",
-            password="TestPassword123!"
-        )
+        credentials = make_creds(*creds_template)
 
         # Verify password exists
         assert len(credentials._password_bytes) > 0
@@ -443,7 +575,9 @@ class TestMemorySecurity:
         # Assert password is cleared
         assert len(credentials._password_bytes) == 0
 
-    def test_clear_password_multiple_times_safe(self) -> None:
+    def test_clear_password_multiple_times_safe(
+        self, creds_template: tuple[str, bytes]
+    ) -> None:
         """T025: Test clear_password() can be called multiple times safely.
 
         Validates:
@@ -452,10 +586,7 @@ class TestMemorySecurity:
 
         Expected outcome: No errors when called repeatedly
         """
-        credentials = IMAPCredentials(
-            email="test@gmail.com",
-            password="TestPassword123!"
-        )
+        credentials = make_creds(*creds_template)
 
         # Clear multiple times - should not raise
         credentials.clear_password()
@@ -465,7 +596,9 @@ class TestMemorySecurity:
         # Assert no errors and password still cleared
         assert len(credentials._password_bytes) == 0
 
-    def test_accessing_password_after_clear_raises_error(self) -> None:
+    def test_accessing_password_after_clear_raises_error(
+        self, creds_template: tuple[str, bytes]
+    ) -> None:
         """T025: Test accessing password after clear raises ValueError.
 
         Validates:
@@ -474,10 +607,7 @@ class TestMemorySecurity:
 
         Expected outcome: ValueError raised with appropriate message
         """
-        credentials = IMAPCredentials(
-            email="test@gmail.com",
-            password="TestPassword123!"
-        )
+        credentials = make_creds(*creds_template)
 
         # Clear password
         credentials.clear_password()
@@ -488,19 +618,18 @@ class TestMemorySecurity:
 
         assert "cleared" in str(exc_info.value).lower()
 
-    def test_del_cleanup_clears_password(self) -> None:
-        """T025: Test __del__ cleanup clears password on deletion.
+    def test_del_cleanup_clears_password(
+        self, creds_template: tuple[str, bytes]
+    ) -> None:
+        """T025: Test finalizer clears password on deletion.
 
         Validates:
         - Password is cleared when object is deleted
-        - __del__ calls clear_password()
+        - The weakref.finalize callback zeroes the buffer
 
         Expected outcome: Password cleared on object deletion
         """
-        credentials = IMAPCredentials(
-            email="test@gmail.com",
-            password="TestPassword123!"
-        )
+        credentials = make_creds(*creds_template)
 
         # Get reference to internal bytearray
         password_bytes = credentials._password_bytes
@@ -512,7 +641,6 @@ class TestMemorySecurity:
         del credentials
 
         # Assert password was cleared (bytearray should be empty)
-        # Note: This is best effort - GC timing is non-deterministic
         assert len(password_bytes) == 0
 
     def test_password_not_in_repr(self) -> None:
@@ -546,10 +674,8 @@ class TestMemorySecurity:
 
         Expected outcome: Custom timestamps stored correctly
         """
-        from datetime import datetime, timedelta
-
-        created = datetime.now() - timedelta(days=7)
-        last_used = datetime.now() - timedelta(days=1)
+        created = _T0
+        last_used = _T0 + timedelta(days=6)
 
         credentials = IMAPCredentials(
             email="test@gmail.com",
@@ -563,7 +689,7 @@ class TestMemorySecurity:
         assert credentials.last_used == last_used
 
         # Assert password still accessible
-        assert credentials.password == "TestPassword123!"
+        assert credentials.password_equals("TestPassword123!")
 
         # Assert password can still be cleared
         credentials.clear_password()
@@ -585,42 +711,34 @@ class TestMemorySecurity:
         )
 
         # Assert password stored and retrieved correctly
+        assert credentials.password_equals(unicode_password)
         assert credentials.password == unicode_password
 
         # Assert can be cleared
         credentials.clear_password()
         assert len(credentials._password_bytes) == 0
 
-    def test_ctypes_memset_called_on_clear(self) -> None:
+    def test_ctypes_memset_called_on_clear(
+        self, creds_template: tuple[str, bytes]
+    ) -> None:
         """T025: Test ctypes.memset is called during clear_password.
 
         Validates:
-        - clear_password() attempts to use ctypes.memset
-        - Fallback works if memset fails
+        - clear_password() zeros the cached buffer with a single memset call
+        - memset receives the buffer address and full password length
 
-        Expected outcome: Password cleared even if memset fails
+        Expected outcome: memset called once, password cleared
         """
-        credentials = IMAPCredentials(
-            email="test@gmail.com",
-            password="TestPassword123!"
-        )
-
-        # Mock ctypes.memset to raise exception
         import ctypes
-        original_memset = ctypes.memset
-
-        def failing_memset(*args, **kwargs):
-            raise Exception("memset failed")
 
-        # Temporarily replace memset
-        ctypes.memset = failing_memset
+        credentials = make_creds(*creds_template)
+        address = ctypes.addressof(credentials._pw_view[0])
+        length = len(credentials._password_bytes)
 
-        try:
-            # Clear should still work (fallback to bytearray.clear())
+        with patch("gmail_classifier.auth.imap._MEMSET") as mock_memset:
+            credentials.clear_password()
             credentials.clear_password()
 
-            # Assert password still cleared despite memset failure
-            assert len(credentials._password_bytes) == 0
-        finally:
-            # Restore original memset
-            ctypes.memset = original_memset
+        # Second call short-circuits: memset runs exactly once
+        mock_memset.assert_called_once_with(address, 0, length)
+        assert len(credentials._password_bytes) == 0
@@ -6,15 +6,46 @@ Tests use mocked IMAPClient to avoid real IMAP server interactions.
 Test Organization:
 - T033: Folder listing (list_folders)
 - T034: Folder selection (select_folder)
+- Message fetch sequence sets
 
 NOTE: These tests use mocked IMAPClient to avoid network operations.
 """
 
+import re
+import time
+from dataclasses import FrozenInstanceError
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from imapclient import IMAPClient
+from imapclient.exceptions import IMAPClientError
 
-from gmail_classifier.auth.imap import IMAPAuthenticator, IMAPCredentials, SessionState
+from gmail_classifier.auth.imap import (
+    IMAPAuthenticator,
+    IMAPCredentials,
+    IMAPSessionError,
+    SessionState,
+)
+from gmail_classifier.email.fetcher import FolderManager, _compress_message_ids
+
+
+# Gmail-format LIST responses shared (read-only) across tests
+_FolderEntry = tuple[tuple[bytes, ...], bytes, str]
+
+_FOLDER_LIST_MULTI: tuple[_FolderEntry, ...] = (
+    ((b"\\HasNoChildren",), b"/", "INBOX"),
+    ((b"\\HasNoChildren", b"\\Sent"), b"/", "[Gmail]/Sent Mail"),
+    ((b"\\HasNoChildren", b"\\Drafts"), b"/", "[Gmail]/Drafts"),
+    ((b"\\HasNoChildren",), b"/", "Work"),
+    ((b"\\HasNoChildren",), b"/", "Projects/Q4"),
+)
+
+_FOLDER_LIST_SINGLE: tuple[_FolderEntry, ...] = (
+    ((b"\\HasNoChildren",), b"/", "INBOX"),
+)
+
+# Error messages for a missing folder mention it by either name
+_FOLDER_ERR_RE = re.compile(r"mailbox|folder", re.IGNORECASE)
 
 
 # ============================================================================
@@ -31,11 +62,19 @@ def test_credentials() -> IMAPCredentials:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def mock_imap_session():
-    """Provide a mocked IMAP session with connection."""
-    with patch("imapclient.IMAPClient") as mock_client_class:
-        mock_client = MagicMock()
+    """Provide a mocked IMAP session with connection, shared per test class.
+
+    None of the folder tests mutate the authenticator, so authenticate()
+    runs once per class; per-test state is reset by _reset_folder_state.
+    The client is specced against IMAPClient so tests cannot configure
+    methods the real client lacks; _imap is an instance attribute of the
+    real client and is attached explicitly.
+    """
+    with patch("gmail_classifier.auth.imap.IMAPClient") as mock_client_class:
+        mock_client = MagicMock(spec=IMAPClient)
+        mock_client._imap = MagicMock()
         mock_client.login.return_value = b"LOGIN completed"
         mock_client.noop.return_value = (b"OK", [b"NOOP completed"])
         mock_client_class.return_value = mock_client
@@ -50,6 +89,32 @@ def mock_imap_session():
         yield (authenticator, session_info, mock_client)
 
 
+@pytest.fixture(scope="class")
+def folder_manager(mock_imap_session) -> FolderManager:
+    """Provide a FolderManager bound to the class-scoped session."""
+    authenticator, _, _ = mock_imap_session
+    return FolderManager(authenticator)
+
+
+@pytest.fixture(autouse=True)
+def _reset_folder_state(mock_imap_session, folder_manager: FolderManager) -> None:
+    """Reset mock call state, folder cache and selection before each test."""
+    _, session_info, mock_client = mock_imap_session
+    mock_client.reset_mock()
+    for method in (
+        mock_client.list_folders,
+        mock_client.select_folder,
+        mock_client.folder_status,
+        mock_client._normalise_folder,
+    ):
+        method.side_effect = None
+    mock_client._imap.reset_mock(return_value=True, side_effect=True)
+    folder_manager._folder_cache.clear()
+    session_info.selected_folder = None
+    session_info.selected_folder_readonly = False
+    session_info.selected_folder_meta = None
+
+
 # ============================================================================
 # T033: Test Folder Listing
 # ============================================================================
@@ -58,7 +123,9 @@ def mock_imap_session():
 class TestFolderListing:
     """Unit tests for listing IMAP folders."""
 
-    def test_list_folders_returns_all_gmail_folders(self, mock_imap_session) -> None:
+    def test_list_folders_returns_all_gmail_folders(
+        self, mock_imap_session, folder_manager
+    ) -> None:
         """T033: Test list_folders() returns all Gmail folders.
 
         Validates:
@@ -69,32 +136,28 @@ class TestFolderListing:
 
         Expected outcome: List of folders with correct types
         """
-        from gmail_classifier.email.fetcher import FolderManager
-
         authenticator, session_info, mock_client = mock_imap_session
 
         # Mock list_folders response (Gmail format)
-        mock_client.list_folders.return_value = [
-            ((b"\\HasNoChildren",), b"/", "INBOX"),
-            ((b"\\HasNoChildren", b"\\Sent"), b"/", "[Gmail]/Sent Mail"),
-            ((b"\\HasNoChildren", b"\\Drafts"), b"/", "[Gmail]/Drafts"),
-            ((b"\\HasNoChildren",), b"/", "Work"),
-            ((b"\\HasNoChildren",), b"/", "Projects/Q4"),
-        ]
-
-        # Create FolderManager
-        folder_manager = FolderManager(authenticator)
+        mock_client.list_folders.return_value = _FOLDER_LIST_MULTI
 
         # Act
         folders = folder_manager.list_folders(session_info.session_id)
 
         # Assert
         assert len(folders) == 5
-        assert any(f.folder_name == "INBOX" for f in folders)
-        assert any(f.folder_name == "[Gmail]/Sent Mail" for f in folders)
-        assert any(f.folder_name == "Work" for f in folders)
+        names = {f.folder_name for f in folders}
+        assert {"INBOX", "[Gmail]/Sent Mail", "Work"}.issubset(names)
+
+        # Filtered listing returns only the requested folders
+        filtered = folder_manager.list_folders(
+            session_info.session_id, names=["Work", "INBOX", "Missing"]
+        )
+        assert [f.folder_name for f in filtered] == ["INBOX", "Work"]
 
-    def test_list_folders_caches_results(self, mock_imap_session) -> None:
+    def test_list_folders_caches_results(
+        self, mock_imap_session, folder_manager
+    ) -> None:
         """T033: Test list_folders() caches folder list.
 
         Validates:
@@ -104,15 +167,9 @@ class TestFolderListing:
 
         Expected outcome: Cached results on subsequent calls
         """
-        from gmail_classifier.email.fetcher import FolderManager
-
         authenticator, session_info, mock_client = mock_imap_session
 
-        mock_client.list_folders.return_value = [
-            ((b"\\HasNoChildren",), b"/", "INBOX"),
-        ]
-
-        folder_manager = FolderManager(authenticator)
+        mock_client.list_folders.return_value = _FOLDER_LIST_SINGLE
 
         # First call
         folders1 = folder_manager.list_folders(session_info.session_id)
@@ -125,7 +182,56 @@ class TestFolderListing:
         # list_folders should be called only once (cached)
         assert mock_client.list_folders.call_count == 1
 
-    def test_list_folders_handles_empty_mailbox(self, mock_imap_session) -> None:
+    def test_list_folders_cache_expires_after_ttl(
+        self, mock_imap_session, folder_manager
+    ) -> None:
+        """T033: Test list_folders() refetches once the cache entry expires.
+
+        Validates:
+        - Entries past their monotonic deadline are treated as stale
+        - A stale entry triggers a new IMAP LIST call
+
+        Expected outcome: Server queried again after expiry
+        """
+        authenticator, session_info, mock_client = mock_imap_session
+
+        mock_client.list_folders.return_value = _FOLDER_LIST_SINGLE
+
+        folder_manager.list_folders(session_info.session_id)
+        cache_entry = folder_manager._folder_cache[session_info.session_id]
+        assert not cache_entry.is_stale()
+
+        cache_entry.deadline_ns = time.monotonic_ns() - 1
+        folder_manager.list_folders(session_info.session_id)
+
+        assert mock_client.list_folders.call_count == 2
+
+    def test_list_folders_reuses_parsed_entries_on_refetch(
+        self, mock_imap_session, folder_manager
+    ) -> None:
+        """T033: Test re-fetched folder lists reuse parsed EmailFolder objects.
+
+        Validates:
+        - Server is queried again once the listing cache is dropped
+        - Unchanged LIST entries map to the same EmailFolder instances
+        - Shared instances are frozen, so counts cannot leak between accounts
+        """
+        authenticator, session_info, mock_client = mock_imap_session
+
+        mock_client.list_folders.return_value = _FOLDER_LIST_MULTI
+
+        folders1 = folder_manager.list_folders(session_info.session_id)
+        folder_manager._folder_cache.clear()
+        folders2 = folder_manager.list_folders(session_info.session_id)
+
+        assert mock_client.list_folders.call_count == 2
+        assert all(a is b for a, b in zip(folders1, folders2, strict=True))
+        with pytest.raises(FrozenInstanceError):
+            folders1[0].message_count = 42
+
+    def test_list_folders_handles_empty_mailbox(
+        self, mock_imap_session, folder_manager
+    ) -> None:
         """T033: Test list_folders() handles empty mailbox.
 
         Validates:
@@ -134,13 +240,10 @@ class TestFolderListing:
 
         Expected outcome: Empty list returned
         """
-        from gmail_classifier.email.fetcher import FolderManager
-
         authenticator, session_info, mock_client = mock_imap_session
 
         mock_client.list_folders.return_value = []
 
-        folder_manager = FolderManager(authenticator)
         folders = folder_manager.list_folders(session_info.session_id)
 
         assert folders == []
@@ -154,7 +257,9 @@ class TestFolderListing:
 class TestFolderSelection:
     """Unit tests for selecting IMAP folders."""
 
-    def test_select_folder_changes_active_folder(self, mock_imap_session) -> None:
+    def test_select_folder_changes_active_folder(
+        self, mock_imap_session, folder_manager
+    ) -> None:
         """T034: Test select_folder() changes active folder and returns metadata.
 
         Validates:
@@ -164,8 +269,6 @@ class TestFolderSelection:
 
         Expected outcome: Folder selected, metadata returned
         """
-        from gmail_classifier.email.fetcher import FolderManager
-
         authenticator, session_info, mock_client = mock_imap_session
 
         # Mock select_folder response
@@ -175,7 +278,6 @@ class TestFolderSelection:
             b"UNSEEN": 3,
         }
 
-        folder_manager = FolderManager(authenticator)
         result = folder_manager.select_folder(session_info.session_id, "INBOX")
 
         # Assert
@@ -187,7 +289,36 @@ class TestFolderSelection:
         session = authenticator.get_session(session_info.session_id)
         assert session.selected_folder == "INBOX"
 
-    def test_select_folder_handles_non_existent_folder(self, mock_imap_session) -> None:
+        # Re-selecting the active folder is served from the session cache
+        assert folder_manager.select_folder(session_info.session_id, "INBOX") == result
+        mock_client.select_folder.assert_called_once()
+
+    def test_select_same_folder_twice_does_one_roundtrip(
+        self, mock_imap_session, folder_manager
+    ) -> None:
+        """T034: Test repeated select_folder() reuses the current selection.
+
+        Validates:
+        - Same folder and mode skips SELECT
+        - A different mode or force=True issues SELECT again
+
+        Expected outcome: SELECT sent only when selection would change
+        """
+        authenticator, session_info, mock_client = mock_imap_session
+
+        mock_client.select_folder.return_value = {b"EXISTS": 7, b"RECENT": 0}
+
+        folder_manager.select_folder(session_info.session_id, "Work")
+        folder_manager.select_folder(session_info.session_id, "Work")
+        assert mock_client.select_folder.call_count == 1
+
+        folder_manager.select_folder(session_info.session_id, "Work", readonly=True)
+        folder_manager.select_folder(session_info.session_id, "Work", readonly=True, force=True)
+        assert mock_client.select_folder.call_count == 3
+
+    def test_select_folder_handles_non_existent_folder(
+        self, mock_imap_session, folder_manager
+    ) -> None:
         """T034: Test select_folder() handles non-existent folder.
 
         Validates:
@@ -196,23 +327,47 @@ class TestFolderSelection:
 
         Expected outcome: Exception raised with clear message
         """
-        from gmail_classifier.email.fetcher import FolderManager
-
         authenticator, session_info, mock_client = mock_imap_session
 
         # Mock select_folder to raise error
-        from imapclient.exceptions import IMAPClientError
-
         mock_client.select_folder.side_effect = IMAPClientError("Mailbox doesn't exist")
 
-        folder_manager = FolderManager(authenticator)
-
         with pytest.raises(Exception) as exc_info:
             folder_manager.select_folder(session_info.session_id, "NonExistent")
 
-        assert "mailbox" in str(exc_info.value).lower() or "folder" in str(exc_info.value).lower()
+        assert _FOLDER_ERR_RE.search(str(exc_info.value))
+
+    def test_failed_select_forgets_previous_folder(
+        self, mock_imap_session, folder_manager
+    ) -> None:
+        """T034: Test a failed SELECT clears the cached selection.
+
+        Validates:
+        - A server NO on SELECT leaves no folder recorded on the session
+        - Re-selecting the previous folder sends SELECT again
+
+        Expected outcome: No stale metadata returned after a failed SELECT
+        """
+        authenticator, session_info, mock_client = mock_imap_session
+
+        mock_client.select_folder.return_value = {b"EXISTS": 3, b"RECENT": 0}
+        folder_manager.select_folder(session_info.session_id, "INBOX")
+
+        mock_client.select_folder.side_effect = IMAPClientError("Mailbox doesn't exist")
+        with pytest.raises(IMAPClientError):
+            folder_manager.select_folder(session_info.session_id, "NonExistent")
+
+        assert session_info.selected_folder is None
+        assert session_info.selected_folder_meta is None
+
+        mock_client.select_folder.side_effect = None
+        folder_manager.select_folder(session_info.session_id, "INBOX")
+        assert mock_client.select_folder.call_count == 3
+        mock_client.select_folder.assert_called_with("INBOX", readonly=False)
 
-    def test_select_folder_readonly_mode(self, mock_imap_session) -> None:
+    def test_select_folder_readonly_mode(
+        self, mock_imap_session, folder_manager
+    ) -> None:
         """T034: Test select_folder() with readonly mode.
 
         Validates:
@@ -221,8 +376,6 @@ class TestFolderSelection:
 
         Expected outcome: Folder selected in readonly mode
         """
-        from gmail_classifier.email.fetcher import FolderManager
-
         authenticator, session_info, mock_client = mock_imap_session
 
         mock_client.select_folder.return_value = {
@@ -230,7 +383,6 @@ class TestFolderSelection:
             b"RECENT": 0,
         }
 
-        folder_manager = FolderManager(authenticator)
         result = folder_manager.select_folder(
             session_info.session_id, "INBOX", readonly=True
         )
@@ -248,7 +400,9 @@ class TestFolderSelection:
 class TestFolderStatus:
     """Unit tests for getting folder status without selecting."""
 
-    def test_get_folder_status_without_selecting(self, mock_imap_session) -> None:
+    def test_get_folder_status_without_selecting(
+        self, mock_imap_session, folder_manager
+    ) -> None:
         """Test get_folder_status() gets info without selecting folder.
 
         Validates:
@@ -258,8 +412,6 @@ class TestFolderStatus:
 
         Expected outcome: Status returned without folder selection
         """
-        from gmail_classifier.email.fetcher import FolderManager
-
         authenticator, session_info, mock_client = mock_imap_session
 
         # Mock folder_status response
@@ -268,7 +420,6 @@ class TestFolderStatus:
             b"UNSEEN": 15,
         }
 
-        folder_manager = FolderManager(authenticator)
         status = folder_manager.get_folder_status(session_info.session_id, "Work")
 
         # Assert
@@ -279,3 +430,170 @@ class TestFolderStatus:
         # Verify selected folder not changed
         session = authenticator.get_session(session_info.session_id)
         assert session.selected_folder != "Work"  # Should still be None or previous folder
+
+    def test_get_folder_statuses_pipelines(
+        self, mock_imap_session, folder_manager
+    ) -> None:
+        """Test get_folder_statuses() sends all STATUS commands before reading.
+
+        Validates:
+        - Every STATUS command is sent before the first completion is read
+        - No per-folder folder_status() round-trips are made
+        - Replies are mapped back to folder names in command order
+
+        Expected outcome: One pipelined batch for all folders
+        """
+        authenticator, session_info, mock_client = mock_imap_session
+
+        imap = mock_client._imap
+        imap._command.side_effect = [b"A001", b"A002"]
+        imap._command_complete.return_value = ("OK", [b"STATUS completed"])
+        imap._untagged_response.return_value = (
+            "OK",
+            [b'"INBOX" (MESSAGES 10 UNSEEN 2)', b'"Work" (MESSAGES 5 UNSEEN 0)'],
+        )
+        mock_client._normalise_folder.side_effect = lambda name: f'"{name}"'
+
+        statuses = folder_manager.get_folder_statuses(
+            session_info.session_id, ["INBOX", "Work"], pipeline=True
+        )
+
+        assert statuses == {
+            "INBOX": {"message_count": 10, "unread_count": 2},
+            "Work": {"message_count": 5, "unread_count": 0},
+        }
+        mock_client.folder_status.assert_not_called()
+        call_names = [name for name, _, _ in imap.mock_calls]
+        assert call_names[:4] == [
+            "_command", "_command", "_command_complete", "_command_complete"
+        ]
+
+    def test_get_folder_statuses_defaults_to_folder_status(
+        self, mock_imap_session, folder_manager
+    ) -> None:
+        """Test get_folder_statuses() uses the public API unless pipelining.
+
+        Validates:
+        - One folder_status() call per folder
+        - imaplib internals are not touched
+
+        Expected outcome: Statuses from folder_status()
+        """
+        authenticator, session_info, mock_client = mock_imap_session
+
+        mock_client.folder_status.return_value = {b"MESSAGES": 3, b"UNSEEN": 1}
+
+        statuses = folder_manager.get_folder_statuses(
+            session_info.session_id, ["INBOX", "Work"]
+        )
+
+        assert statuses == {
+            "INBOX": {"message_count": 3, "unread_count": 1},
+            "Work": {"message_count": 3, "unread_count": 1},
+        }
+        assert mock_client.folder_status.call_count == 2
+        mock_client._imap._command.assert_not_called()
+
+    def test_get_folder_statuses_pipeline_drains_after_bad_reply(
+        self, mock_imap_session, folder_manager
+    ) -> None:
+        """Test a failing tag does not leave later replies unread.
+
+        Validates:
+        - A BAD reply (raised by imaplib) on the first tag is caught
+        - The remaining tags and untagged replies are still drained
+        - The failure surfaces as IMAPSessionError
+
+        Expected outcome: Every tag read, then IMAPSessionError
+        """
+        authenticator, session_info, mock_client = mock_imap_session
+
+        imap = mock_client._imap
+        imap._command.side_effect = [b"A001", b"A002"]
+        imap._command_complete.side_effect = [
+            IMAPClientError("STATUS command error: BAD"),
+            ("OK", [b"STATUS completed"]),
+        ]
+        imap._untagged_response.return_value = ("OK", [b'"Work" (MESSAGES 5 UNSEEN 0)'])
+        mock_client._normalise_folder.side_effect = lambda name: f'"{name}"'
+
+        with pytest.raises(IMAPSessionError, match="BAD"):
+            folder_manager.get_folder_statuses(
+                session_info.session_id, ["Missing", "Work"], pipeline=True
+            )
+
+        assert imap._command_complete.call_count == 2
+        imap._untagged_response.assert_called_once()
+
+    def test_get_folder_statuses_pipeline_parses_literal_names(
+        self, mock_imap_session, folder_manager
+    ) -> None:
+        """Test pipelined replies with a literal folder name are parsed.
+
+        Validates:
+        - A folder name sent as an IMAP literal does not shift the replies
+
+        Expected outcome: Counts mapped to the right folders
+        """
+        authenticator, session_info, mock_client = mock_imap_session
+
+        imap = mock_client._imap
+        imap._command.side_effect = [b"A001", b"A002"]
+        imap._command_complete.return_value = ("OK", [b"STATUS completed"])
+        imap._untagged_response.return_value = (
+            "OK",
+            [
+                (b"{7}", b"Caf\xc3\xa9 1"),
+                b" (MESSAGES 4 UNSEEN 4)",
+                b'"Work" (MESSAGES 5 UNSEEN 0)',
+            ],
+        )
+        mock_client._normalise_folder.side_effect = lambda name: f'"{name}"'
+
+        statuses = folder_manager.get_folder_statuses(
+            session_info.session_id, ["Café 1", "Work"], pipeline=True
+        )
+
+        assert statuses == {
+            "Café 1": {"message_count": 4, "unread_count": 4},
+            "Work": {"message_count": 5, "unread_count": 0},
+        }
+
+
+# ============================================================================
+# Test Message Fetch Sequence Sets
+# ============================================================================
+
+
+class TestMessageIdCompression:
+    """Unit tests for compressing message IDs into IMAP sequence sets."""
+
+    @pytest.mark.parametrize(
+        ("message_ids", "expected"),
+        [
+            ([1, 2, 3, 5, 6, 10], "1:3,5:6,10"),
+            ([42], "42"),
+            ([], ""),
+            ([7, 3, 4, 5], "7,3:5"),
+        ],
+    )
+    def test_compress_message_ids(self, message_ids, expected) -> None:
+        """Test consecutive runs collapse to ranges, preserving order."""
+        assert _compress_message_ids(message_ids) == expected
+
+    def test_fetch_emails_sends_compressed_sequence_set(
+        self, mock_imap_session, folder_manager
+    ) -> None:
+        """Test fetch_emails() requests a batch as one compact sequence set.
+
+        Validates:
+        - FETCH receives "start:end" ranges instead of one ID per message
+        """
+        authenticator, session_info, mock_client = mock_imap_session
+        session_info.selected_folder = "INBOX"
+        mock_client.search.return_value = [1, 2, 3, 5, 6, 10]
+        mock_client.fetch.return_value = {}
+
+        folder_manager.fetch_emails(session_info.session_id)
+
+        assert mock_client.fetch.call_args.args[0] == "1:3,5:6,10"
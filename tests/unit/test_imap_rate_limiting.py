@@ -0,0 +1,318 @@
+"""Unit tests for IMAP authentication rate limiting.
+
+These tests verify failed-attempt tracking, window expiry, and exponential
+lockout in IMAPAuthenticator._check_rate_limit.
+
+Test Organization:
+- Failed attempt window cleanup
+- Exponential lockout
+- Concurrent authentication attempts
+
+NOTE: Window and lockout timing is driven through the authenticator's
+injectable _now clock; only the concurrency test sleeps, briefly, to make
+login attempts overlap.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from imapclient.exceptions import IMAPClientError
+
+from gmail_classifier.auth.imap import (
+    MAX_SESSIONS_PER_EMAIL,
+    MAX_TRACKED_FAILURES,
+    RATE_LIMIT_MAX_FAILURES,
+    RATE_LIMIT_WINDOW_SECONDS,
+    ErrorCode,
+    IMAPAuthenticationError,
+    IMAPAuthenticator,
+    IMAPCredentials,
+    IMAPSessionInfo,
+    SessionState,
+)
+
+EMAIL = "test@gmail.com"
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture(scope="class")
+def authenticator() -> IMAPAuthenticator:
+    """Provide an IMAPAuthenticator without a cleanup thread, shared per class.
+
+    The cleanup-thread patch is only active during construction. All mutable
+    state is reset before each test by _reset_authenticator.
+    """
+    with patch.object(IMAPAuthenticator, "_start_cleanup_thread"):
+        return IMAPAuthenticator()
+
+
+@pytest.fixture(autouse=True)
+def _reset_authenticator(authenticator: IMAPAuthenticator) -> None:
+    """Clear rate-limit, session and pool state and restore the real clock."""
+    authenticator._now = time.monotonic
+    authenticator._failed_attempts.clear()
+    authenticator._lockout_until.clear()
+    authenticator._lockout_heap.clear()
+    authenticator._attempts_in_flight.clear()
+    authenticator._sessions.clear()
+    authenticator._pinned.clear()
+    authenticator._sessions_by_email.clear()
+    authenticator._pool.clear()
+    authenticator._session_pool_keys.clear()
+
+
+@pytest.fixture
+def clock(authenticator: IMAPAuthenticator) -> SimpleNamespace:
+    """Replace the authenticator's monotonic clock with a settable one.
+
+    Returns:
+        Namespace whose ``t`` (seconds) is returned by authenticator._now()
+    """
+    state = SimpleNamespace(t=10_000.0)
+    authenticator._now = lambda: state.t
+    return state
+
+
+def record_failures(authenticator: IMAPAuthenticator, count: int) -> None:
+    """Record count failed attempts for EMAIL at the current clock time."""
+    authenticator._failed_attempts[EMAIL].extend([authenticator._now()] * count)
+
+
+# ============================================================================
+# Failed Attempt Window
+# ============================================================================
+
+
+class TestRateLimitCleanup:
+    """Unit tests for expiring and bounding failed-attempt records."""
+
+    def test_old_attempts_cleaned_after_15_minutes(
+        self, authenticator: IMAPAuthenticator, clock: SimpleNamespace
+    ) -> None:
+        """Test attempts older than the window are forgotten.
+
+        Validates:
+        - Failures past RATE_LIMIT_WINDOW_SECONDS no longer count
+        - No lockout is applied for expired failures
+        """
+        record_failures(authenticator, 4)
+        clock.t += RATE_LIMIT_WINDOW_SECONDS + 1
+        record_failures(authenticator, 1)
+
+        authenticator._check_rate_limit(EMAIL)
+
+        assert len(authenticator._failed_attempts[EMAIL]) == 1
+        assert EMAIL not in authenticator._lockout_until
+
+    def test_memory_not_leaked_by_failed_attempts(
+        self, authenticator: IMAPAuthenticator, clock: SimpleNamespace
+    ) -> None:
+        """Test per-email failure records stay bounded and are released.
+
+        Validates:
+        - At most MAX_TRACKED_FAILURES timestamps are kept per email
+        - The email's entry is dropped once all failures expire
+        - Checking an unknown email allocates nothing
+        """
+        record_failures(authenticator, MAX_TRACKED_FAILURES + 36)
+        assert len(authenticator._failed_attempts[EMAIL]) == MAX_TRACKED_FAILURES
+
+        clock.t += RATE_LIMIT_WINDOW_SECONDS + 1
+        authenticator._check_rate_limit(EMAIL)
+        authenticator._check_rate_limit("other@gmail.com")
+
+        assert authenticator._failed_attempts == {}
+
+
+# ============================================================================
+# Exponential Lockout
+# ============================================================================
+
+
+class TestExponentialLockout:
+    """Unit tests for lockout escalation after repeated failures."""
+
+    @pytest.mark.parametrize(
+        ("failures", "lockout_minutes"),
+        [(5, 2), (6, 4), (7, 8), (9, 32), (10, 64), (20, 64)],
+    )
+    def test_exponential_lockout_progression(
+        self,
+        authenticator: IMAPAuthenticator,
+        clock: SimpleNamespace,
+        failures: int,
+        lockout_minutes: int,
+    ) -> None:
+        """Test lockout doubles per failure past the threshold, capped at 64 min.
+
+        Validates:
+        - 5 failures lock out for 2 minutes, doubling per extra failure
+        - Lockout never exceeds 64 minutes
+        """
+        record_failures(authenticator, failures)
+
+        with pytest.raises(
+            IMAPAuthenticationError, match=f"Locked out for {lockout_minutes} minutes"
+        ) as exc_info:
+            authenticator._check_rate_limit(EMAIL)
+
+        assert exc_info.value.code == ErrorCode.LOCKED_OUT
+        assert exc_info.value.retry_after_seconds == lockout_minutes * 60
+        assert authenticator._lockout_until[EMAIL] == clock.t + lockout_minutes * 60
+
+    def test_lockout_prevents_immediate_retry(
+        self, authenticator: IMAPAuthenticator, clock: SimpleNamespace
+    ) -> None:
+        """Test a locked-out email is rejected until the lockout expires.
+
+        Validates:
+        - Checks during lockout report the remaining seconds, also as
+          retry_after_seconds (rounded up)
+        - Checks after lockout expiry and window expiry succeed
+        """
+        record_failures(authenticator, 5)
+        with pytest.raises(IMAPAuthenticationError):
+            authenticator._check_rate_limit(EMAIL)
+
+        clock.t += 30
+        with pytest.raises(
+            IMAPAuthenticationError, match="Try again in 90 seconds"
+        ) as exc_info:
+            authenticator._check_rate_limit(EMAIL)
+        assert exc_info.value.code == ErrorCode.LOCKED_OUT
+        assert exc_info.value.retry_after_seconds == 90
+
+        clock.t += 0.5
+        with pytest.raises(IMAPAuthenticationError) as exc_info:
+            authenticator._check_rate_limit(EMAIL)
+        assert exc_info.value.retry_after_seconds == 90
+
+        clock.t += RATE_LIMIT_WINDOW_SECONDS
+        authenticator._check_rate_limit(EMAIL)
+
+    def test_expired_lockouts_purged_for_all_emails(
+        self, authenticator: IMAPAuthenticator, clock: SimpleNamespace
+    ) -> None:
+        """Test expired lockouts are dropped without scanning live ones.
+
+        Validates:
+        - A check for any email purges every expired lockout
+        - Unexpired lockouts, and their heap entries, are kept
+        """
+        for i in range(400):
+            email = f"user{i}@gmail.com"
+            authenticator._failed_attempts[email].extend([clock.t] * 5)
+            with pytest.raises(IMAPAuthenticationError):
+                authenticator._check_rate_limit(email)
+            authenticator._failed_attempts.pop(email)
+            if i == 199:
+                clock.t += 60  # the first half expires 60s before the second
+
+        clock.t += 60  # first half's 2-minute lockouts have now ended
+        authenticator._check_rate_limit(EMAIL)
+
+        assert len(authenticator._lockout_until) == 200
+        assert len(authenticator._lockout_heap) == 200
+        assert "user0@gmail.com" not in authenticator._lockout_until
+        assert "user200@gmail.com" in authenticator._lockout_until
+
+    def test_lockout_ignores_email_case(
+        self, authenticator: IMAPAuthenticator, clock: SimpleNamespace
+    ) -> None:
+        """Test changing the email's case does not bypass a lockout.
+
+        Validates:
+        - Credentials are keyed by their lower-cased email
+        - A mixed-case login is rejected while the account is locked out
+        """
+        credentials = IMAPCredentials(email="Test@Gmail.com", password="abcdefghijklmnop")
+        assert credentials.key == EMAIL
+
+        record_failures(authenticator, 5)
+        with pytest.raises(IMAPAuthenticationError) as exc_info:
+            authenticator.authenticate(credentials)
+
+        assert exc_info.value.code == ErrorCode.LOCKED_OUT
+
+    def test_session_limit_ignores_email_case(
+        self, authenticator: IMAPAuthenticator
+    ) -> None:
+        """Test changing the email's case does not bypass the session limit.
+
+        Validates:
+        - Sessions are grouped by their lower-cased email
+        - A mixed-case login evicts the least recently active session
+        """
+        sessions = [
+            IMAPSessionInfo(email=EMAIL, state=SessionState.CONNECTED)
+            for _ in range(MAX_SESSIONS_PER_EMAIL)
+        ]
+        for session in sessions:
+            authenticator._track_session(session)
+
+        credentials = IMAPCredentials(email="Test@Gmail.com", password="abcdefghijklmnop")
+        client = Mock()
+        client.login.return_value = b"OK"
+        client.noop.return_value = b"OK"
+
+        with (
+            patch("gmail_classifier.auth.imap.IMAPClient", return_value=client),
+            patch.object(authenticator, "disconnect") as mock_disconnect,
+        ):
+            new_session = authenticator.authenticate(credentials)
+
+        mock_disconnect.assert_called_once_with(sessions[0].session_id, reuse=False)
+        assert new_session.session_id in authenticator._sessions_by_email[EMAIL]
+        assert list(authenticator._sessions_by_email) == [EMAIL]
+
+
+# ============================================================================
+# Concurrent Authentication Attempts
+# ============================================================================
+
+
+class TestRateLimitConcurrency:
+    """Unit tests for rate limiting under concurrent logins."""
+
+    def test_rate_limit_thread_safe(self, authenticator: IMAPAuthenticator) -> None:
+        """Test concurrent failing logins cannot overshoot the failure threshold.
+
+        Validates:
+        - At most RATE_LIMIT_MAX_FAILURES logins reach the server
+        - Every rejected or failed attempt raises IMAPAuthenticationError
+        - Each error carries a bad-credentials, rate-limited or locked-out code
+        - In-flight attempt slots are all released afterwards
+        """
+        credentials = IMAPCredentials(email=EMAIL, password="abcdefghijklmnop")
+
+        def failing_login(*args) -> None:
+            time.sleep(0.01)  # hold the attempt open so threads overlap
+            raise IMAPClientError("Invalid credentials")
+
+        client = Mock()
+        client.login.side_effect = failing_login
+
+        def attempt() -> None:
+            with pytest.raises(IMAPAuthenticationError) as exc_info:
+                authenticator.authenticate(credentials)
+            assert exc_info.value.code in (
+                ErrorCode.BAD_CREDENTIALS,
+                ErrorCode.RATE_LIMITED,
+                ErrorCode.LOCKED_OUT,
+            )
+
+        with patch("gmail_classifier.auth.imap.IMAPClient", return_value=client):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                for future in [pool.submit(attempt) for _ in range(40)]:
+                    future.result()
+
+        assert client.login.call_count <= RATE_LIMIT_MAX_FAILURES
+        assert len(authenticator._failed_attempts[EMAIL]) <= RATE_LIMIT_MAX_FAILURES
+        assert not authenticator._attempts_in_flight
@@ -1,5 +1,7 @@
 """Unit tests for Label model."""
 
+import dataclasses
+
 import pytest
 
 from gmail_classifier.models.label import Label
@@ -142,3 +144,26 @@ class TestLabelModel:
         assert "name='Work'" in repr_str
         assert "email_count=42" in repr_str
         assert "type='user'" in repr_str
+
+    def test_label_is_immutable_and_hashable(self):
+        """Test labels are frozen and usable as set members."""
+        label = Label(id="Label_123", name="Work", email_count=42, type="user")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            label.name = "Other"
+
+        duplicate = Label(id="Label_123", name="Work", email_count=42, type="user")
+        assert {label, duplicate} == {label}
+
+    def test_from_gmail_labels_matches_single_item_form(self):
+        """Test bulk creation yields the same labels as per-item creation."""
+        ids = ["INBOX", "SENT", "CATEGORY_SOCIAL", "Label_1", "SENT_custom"]
+        gmail_labels = [
+            {"id": f"{ids[i % len(ids)]}", "name": f"Name {i}", "messagesTotal": i}
+            for i in range(100)
+        ]
+
+        bulk = Label.from_gmail_labels(gmail_labels)
+
+        assert bulk == [Label.from_gmail_label(label) for label in gmail_labels]
+        assert bulk[4].type == "user"  # exact ID match, not a prefix match
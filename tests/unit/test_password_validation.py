@@ -333,3 +333,43 @@ class TestEdgeCases:
             password="qwer tyui opas dfgh"  # 16 letters with spaces
         )
         assert credentials.password == "qwer tyui opas dfgh"
+
+
+class TestBytearrayValidation:
+    """Tests that bytearray passwords are validated like their str form."""
+
+    @pytest.mark.parametrize(
+        "password",
+        [
+            "abcdefghijklmnop",
+            "abcd efgh ijkl mnop",
+            "AbCdEfGhIjKlMnOp",
+            "abcdefghijklm123",
+            "Short1!",
+            "A" * 65,
+            "passwordonly",
+            "Password123!",
+            "P@ssw0rd#$%^&*()",
+            "Passsword123!",
+            "Password 123",
+            "Пароль123!Test",
+            "пароль пароль пароль",
+        ],
+    )
+    def test_bytearray_matches_str_validation(self, password: str) -> None:
+        """A bytearray password is accepted or rejected with the same message."""
+        try:
+            IMAPCredentials(email="test@gmail.com", password=password)
+        except ValueError as exc:
+            expected: str | None = str(exc)
+        else:
+            expected = None
+
+        try:
+            IMAPCredentials(
+                email="test@gmail.com", password=bytearray(password.encode("utf-8"))
+            )
+        except ValueError as exc:
+            assert str(exc) == expected
+        else:
+            assert expected is None
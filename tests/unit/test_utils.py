@@ -5,6 +5,7 @@ from gmail_classifier.lib.utils import (
     batch_items,
     format_confidence,
     get_confidence_category,
+    iter_batches,
     sanitize_email_content,
     safe_int,
     safe_float,
@@ -16,83 +17,69 @@ from gmail_classifier.lib.utils import (
 class TestBatchItems:
     """Test batch_items function."""
 
-    def test_batch_items_evenly_divisible(self):
-        """Test batching with evenly divisible items."""
-        items = [1, 2, 3, 4, 5, 6]
-        batches = batch_items(items, 2)
-
-        assert batches == [[1, 2], [3, 4], [5, 6]]
-
-    def test_batch_items_with_remainder(self):
-        """Test batching with remainder items."""
-        items = [1, 2, 3, 4, 5]
-        batches = batch_items(items, 2)
-
-        assert batches == [[1, 2], [3, 4], [5]]
-
-    def test_batch_items_single_batch(self):
-        """Test batching where batch size equals list size."""
-        items = [1, 2, 3]
-        batches = batch_items(items, 3)
-
-        assert batches == [[1, 2, 3]]
-
-    def test_batch_items_larger_batch_size(self):
-        """Test batching with batch size larger than list."""
-        items = [1, 2, 3]
-        batches = batch_items(items, 10)
-
-        assert batches == [[1, 2, 3]]
-
-    def test_batch_items_empty_list(self):
-        """Test batching empty list."""
-        batches = batch_items([], 5)
-
-        assert batches == []
+    @pytest.mark.parametrize(
+        ("items", "batch_size", "expected"),
+        [
+            ([1, 2, 3, 4, 5, 6], 2, [[1, 2], [3, 4], [5, 6]]),
+            ([1, 2, 3, 4, 5], 2, [[1, 2], [3, 4], [5]]),
+            ([1, 2, 3], 3, [[1, 2, 3]]),
+            ([1, 2, 3], 10, [[1, 2, 3]]),
+            ([], 5, []),
+        ],
+        ids=[
+            "evenly_divisible",
+            "with_remainder",
+            "single_batch",
+            "larger_batch_size",
+            "empty_list",
+        ],
+    )
+    def test_batch_items(self, items, batch_size, expected):
+        """Test batching splits items into consecutive chunks of batch_size."""
+        assert batch_items(items, batch_size) == expected
+
+    def test_iter_batches_matches_batch_items(self):
+        """Test the lazy variant yields the same batches from an iterator."""
+        items = list(range(7))
+
+        batches = iter_batches(iter(items), 3)
+
+        assert next(batches) == [0, 1, 2]
+        assert list(batches) == batch_items(items, 3)[1:]
 
 
 class TestFormatConfidence:
     """Test format_confidence function."""
 
-    def test_format_confidence_high(self):
-        """Test formatting high confidence score."""
-        assert format_confidence(0.875) == "87.5%"
-
-    def test_format_confidence_low(self):
-        """Test formatting low confidence score."""
-        assert format_confidence(0.123) == "12.3%"
-
-    def test_format_confidence_perfect(self):
-        """Test formatting perfect confidence."""
-        assert format_confidence(1.0) == "100.0%"
-
-    def test_format_confidence_zero(self):
-        """Test formatting zero confidence."""
-        assert format_confidence(0.0) == "0.0%"
+    @pytest.mark.parametrize(
+        ("score", "expected"),
+        [(0.875, "87.5%"), (0.123, "12.3%"), (1.0, "100.0%"), (0.0, "0.0%")],
+        ids=["high", "low", "perfect", "zero"],
+    )
+    def test_format_confidence(self, score, expected):
+        """Test formatting a confidence score as a one-decimal percentage."""
+        assert format_confidence(score) == expected
 
 
 class TestGetConfidenceCategory:
     """Test get_confidence_category function."""
 
-    def test_confidence_category_high(self):
-        """Test high confidence categorization."""
-        assert get_confidence_category(0.85) == "high"
-        assert get_confidence_category(0.7) == "high"
-
-    def test_confidence_category_medium(self):
-        """Test medium confidence categorization."""
-        assert get_confidence_category(0.65) == "medium"
-        assert get_confidence_category(0.5) == "medium"
-
-    def test_confidence_category_low(self):
-        """Test low confidence categorization."""
-        assert get_confidence_category(0.45) == "low"
-        assert get_confidence_category(0.3) == "low"
-
-    def test_confidence_category_no_match(self):
-        """Test no match categorization."""
-        assert get_confidence_category(0.25) == "no_match"
-        assert get_confidence_category(0.0) == "no_match"
+    @pytest.mark.parametrize(
+        ("score", "expected"),
+        [
+            (0.85, "high"),
+            (0.7, "high"),
+            (0.65, "medium"),
+            (0.5, "medium"),
+            (0.45, "low"),
+            (0.3, "low"),
+            (0.25, "no_match"),
+            (0.0, "no_match"),
+        ],
+    )
+    def test_confidence_category(self, score, expected):
+        """Test scores map to categories, thresholds inclusive."""
+        assert get_confidence_category(score) == expected
 
 
 class TestSanitizeEmailContent: